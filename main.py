@@ -5,29 +5,20 @@ Main entry point for the application.
 """
 
 import argparse
+import os
 import sys
-from pathlib import Path
-
-# Get the project root directory
-project_root = Path(__file__).parent.resolve()
-src_path = project_root / "src"
 
 # Add src to Python path so 'zesec' package can be imported
-if str(src_path) not in sys.path:
-    sys.path.insert(0, str(src_path))
-
-# Now import from zesec package
-try:
-    from zesec.console import main as console_main
-except ImportError as e:
-    print(f"Import error: {e}", file=sys.stderr)
-    print(f"Python path: {sys.path}", file=sys.stderr)
-    print(f"Looking for package in: {src_path}", file=sys.stderr)
-    sys.exit(1)
+src_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "src")
+sys.path.insert(0, src_path)
 
 
-def main() -> int:
-    """Main entry point that routes to console or GUI mode."""
+def _parse_args(argv: list[str]) -> argparse.Namespace:
+    """Parse command line arguments with argparse.
+    
+    Only needed for --help and invalid arguments; the common invocations
+    are recognised directly in main().
+    """
     parser = argparse.ArgumentParser(
         description="Zesec - Secure file encryption and cleaning tool"
     )
@@ -36,10 +27,20 @@ def main() -> int:
         action="store_true",
         help="Launch the graphical user interface"
     )
+    return parser.parse_args(argv)
+
+
+def main() -> int:
+    """Main entry point that routes to console or GUI mode."""
+    argv = sys.argv[1:]
     
-    args = parser.parse_args()
+    # Fast path: no arguments or just --gui, no need to build a parser
+    if argv and any(arg != "--gui" for arg in argv):
+        gui = _parse_args(argv).gui
+    else:
+        gui = "--gui" in argv
     
-    if args.gui:
+    if gui:
         # Import and run GUI
         try:
             from zesec.gui import main as gui_main
@@ -50,6 +51,13 @@ def main() -> int:
             return 1
     else:
         # Run console mode
+        try:
+            from zesec.console import main as console_main
+        except ImportError as e:
+            print(f"Import error: {e}", file=sys.stderr)
+            print(f"Python path: {sys.path}", file=sys.stderr)
+            print(f"Looking for package in: {src_path}", file=sys.stderr)
+            return 1
         return console_main()
 
 
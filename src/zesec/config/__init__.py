@@ -1,6 +1,16 @@
 """Configuration management module."""
 
-from .settings import Settings
+from typing import Any
 
-__all__ = ["Settings"]
+from .settings import get_settings
 
+__all__ = ["Settings", "get_settings"]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve ``Settings`` lazily so importing the package stays cheap."""
+    if name == "Settings":
+        from ._model import Settings
+
+        return Settings
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,119 @@
+"""Pydantic settings model.
+
+Imported lazily by :mod:`zesec.config.settings` so that pydantic is only
+loaded once settings are actually needed.
+"""
+
+import os
+from pathlib import Path
+from typing import Any, Optional
+
+from pydantic import PrivateAttr
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from .settings import APP_NAME, APP_VERSION, ENCRYPTED_EXTENSION, get_settings
+
+
+class Settings(BaseSettings):
+    """Application settings - loaded once from .env file.
+    
+    This is a singleton pattern to ensure settings are loaded once
+    and accessed consistently throughout the application.
+    """
+
+    # Encryption settings
+    ENCRYPTION_ALGORITHM: str = "AES-256-GCM"
+    KEY_DERIVATION_ITERATIONS: int = 100000
+    KDF_HASH: str = "SHA-256"  # PBKDF2 hash for new files: SHA-256 or SHA-512
+    NONCE_SIZE: int = 12
+    KEY_SIZE: int = 32  # 256 bits for AES-256
+    TAG_SIZE: int = 16  # GCM authentication tag size
+    # Write new key files as raw bytes instead of base64 text. Off by default:
+    # releases before raw key support cannot read raw key files.
+    KEY_FILE_RAW: bool = False
+
+    # File operations
+    CLEAN_PASSES: int = 3  # Number of overwrite passes for secure deletion
+    # Use a single pass on solid-state storage, where extra passes are remapped
+    CLEAN_SSD_SINGLE_PASS: bool = True
+    # Discard (TRIM) file blocks on solid-state storage instead of overwriting
+    CLEAN_SSD_TRIM: bool = False
+    BUFFER_SIZE: int = 1024 * 1024  # 1MB buffer for file operations
+    # Files cleaned concurrently by clean_directory (1 = one at a time)
+    CLEAN_WORKERS: int = min(32, 4 * (os.cpu_count() or 1))
+
+    # Logging
+    LOG_LEVEL: str = "INFO"
+    LOG_FILE: Optional[str] = None
+    LOG_FORMAT: str = "{time:YYYY-MM-DD HH:mm:ss} | {level} | {name}:{function} | {message}"
+
+    # Application
+    APP_NAME: str = APP_NAME
+    APP_VERSION: str = APP_VERSION
+
+    # File extensions
+    ENCRYPTED_EXTENSION: str = ENCRYPTED_EXTENSION
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=True,
+        extra="ignore",  # Ignore extra env vars
+    )
+
+    # Encrypted extension and its length, cached for the path helpers
+    _ext: str = PrivateAttr(default=ENCRYPTED_EXTENSION)
+    _ext_len: int = PrivateAttr(default=len(ENCRYPTED_EXTENSION))
+
+    def model_post_init(self, __context: Any) -> None:
+        """Cache values derived from the loaded settings."""
+        self._ext = self.ENCRYPTED_EXTENSION
+        self._ext_len = len(self.ENCRYPTED_EXTENSION)
+
+    @classmethod
+    def get_instance(cls) -> "Settings":
+        """Get singleton instance of settings.
+        
+        Kept for compatibility - prefer :func:`zesec.config.settings.get_settings`.
+        
+        Returns:
+            Settings instance (cached after first call)
+        """
+        return get_settings()
+
+    def get_log_file_path(self) -> Optional[Path]:
+        """Get log file path if configured.
+        
+        Returns:
+            Path to log file or None if not configured
+        """
+        if self.LOG_FILE:
+            return Path(self.LOG_FILE)
+        return None
+
+    def get_encrypted_path(self, original_path: Path) -> Path:
+        """Get encrypted file path from original path.
+        
+        Args:
+            original_path: Original file path
+            
+        Returns:
+            Path with encrypted extension
+        """
+        return original_path.parent / (original_path.name + self._ext)
+
+    def get_decrypted_path(self, encrypted_path: Path) -> Path:
+        """Get decrypted file path from encrypted path.
+        
+        Args:
+            encrypted_path: Encrypted file path
+            
+        Returns:
+            Path with encrypted extension removed
+        """
+        name = encrypted_path.name
+        if name.endswith(self._ext):
+            # Remove encrypted extension
+            return encrypted_path.parent / name[: -self._ext_len]
+        return encrypted_path.with_suffix("")
+
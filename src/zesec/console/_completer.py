@@ -0,0 +1,41 @@
+"""Command name completion for the interactive prompt."""
+
+from typing import Iterable
+
+from prompt_toolkit.completion import CompleteEvent, Completer, Completion
+from prompt_toolkit.document import Document
+
+from .command_parser import CommandParser
+
+
+class CommandCompleter(Completer):
+    """Completes command names from the parser's sorted command list."""
+
+    def __init__(self, command_parser: CommandParser):
+        """Initialize completer.
+        
+        Args:
+            command_parser: Parser whose commands are offered as completions
+        """
+        self._command_parser = command_parser
+
+    def get_completions(
+        self, document: Document, complete_event: CompleteEvent
+    ) -> Iterable[Completion]:
+        """Yield command names matching the word being typed.
+        
+        Only the first word is completed; arguments are left alone.
+        
+        Args:
+            document: Current prompt document
+            complete_event: Event that triggered completion
+            
+        Yields:
+            Completion for each matching command name
+        """
+        word = document.text_before_cursor.lstrip()
+        if " " in word:
+            return
+        start_position = -len(word)
+        for name in self._command_parser.iter_command_suggestions(word):
+            yield Completion(name, start_position=start_position)
@@ -0,0 +1,19 @@
+"""Shared Rich console for console output."""
+
+from functools import cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+@cache
+def get_console() -> "Console":
+    """Get the shared Rich console, importing Rich on first use.
+    
+    Returns:
+        Console instance (created on first call)
+    """
+    from rich.console import Console
+
+    return Console()
@@ -1,72 +1,97 @@
 """Command parser for interactive console."""
 
 import shlex
-from typing import Optional
+import sys
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Callable, Iterator, Optional
 
-from rich.console import Console
-
-from ..di.container import ApplicationContainer
+from ..utils.exceptions import ZesecError
+from ._console import get_console
 from .commands.base import BaseCommand, CommandRegistry
-from .commands.loader import discover_commands, create_command_instance
+from .commands.loader import (
+    create_command_instance,
+    get_default_container,
+)
 
-console = Console()
+if TYPE_CHECKING:
+    from ..di.container import ApplicationContainer
 
 
 class CommandParser:
     """Parses and executes console commands."""
 
-    def __init__(self, container: Optional[ApplicationContainer] = None):
+    def __init__(self, container: Optional["ApplicationContainer"] = None):
         """Initialize command parser.
         
+        Commands are not imported or instantiated here; each one is created
+        on first use from its factory.
+        
         Args:
-            container: Optional DI container. If None, creates a new one.
+            container: Optional DI container. If None, the shared default
+                container is used by commands that need one.
         """
-        self._container = container or ApplicationContainer()
+        self._container = container
         
-        # Auto-discover all commands
-        discover_commands()
-        
-        # Build command instances from registry
+        # Command name -> factory, and memoized instances created from them
+        # Names are interned so dispatch lookups compare by identity
+        self._command_factories: dict[str, Callable[[], Optional[BaseCommand]]] = {
+            sys.intern(name): self._make_factory(name)
+            for name in CommandRegistry.get_lazy_names()
+        }
+        self._command_factories[sys.intern("help")] = self._create_help_command
+        self._command_names: frozenset[str] = frozenset(self._command_factories)
+        self._sorted_names: list[str] = sorted(self._command_factories)
         self._commands: dict[str, BaseCommand] = {}
-        all_commands = CommandRegistry.get_all_commands()
+
+    def _make_factory(self, name: str) -> Callable[[], Optional[BaseCommand]]:
+        """Build a factory that loads a command and instantiates it."""
+        def factory() -> Optional[BaseCommand]:
+            # Looking the command up imports its module on first use
+            info = CommandRegistry.get_command_info(name)
+            if info is None:
+                return None
+            # Aliases share the instance of their primary command
+            primary = CommandRegistry.resolve_name(name)
+            if primary != name:
+                return self.get_command(primary)
+            container = self._get_container() if info.requires_container else None
+            return create_command_instance(name, container)
+        return factory
+
+    def _create_help_command(self) -> BaseCommand:
+        """Create the help command.
         
-        # Track which command classes we've already instantiated
-        # (to avoid creating multiple instances for aliases)
-        instantiated_classes = {}
-        processed_names = set()
+        The general listing comes from the command manifest; command
+        modules are only loaded when help for a specific command is shown.
+        """
+        from .commands.help_command import HelpCommand
+        return HelpCommand(command_lookup=self.get_command)
+
+    def _get_container(self) -> "ApplicationContainer":
+        """Get the DI container, falling back to the shared default."""
+        if self._container is None:
+            self._container = get_default_container()
+        return self._container
+
+    def get_command(self, command_name: str) -> Optional[BaseCommand]:
+        """Get a command instance by name, creating it on first use.
         
-        for name, info in all_commands.items():
-            # Skip if we've already processed this command (could be an alias entry)
-            if name in processed_names:
-                continue
-            
-            command_class = info["class"]
-            
-            # If we've already instantiated this class, reuse the instance
-            if command_class in instantiated_classes:
-                instance = instantiated_classes[command_class]
-            else:
-                # Create new instance
-                instance = create_command_instance(name, self._container)
-                if instance:
-                    instantiated_classes[command_class] = instance
-                else:
-                    continue
-            
-            # Register this name and all its aliases
-            self._commands[name] = instance
-            processed_names.add(name)
+        Args:
+            command_name: Command name or alias
             
-            for alias in info.get("aliases", []):
-                self._commands[alias] = instance
-                processed_names.add(alias)
-        
-        # Special case: HelpCommand needs the registry after all commands are loaded
-        # Re-instantiate it with the commands registry
-        if "help" in self._commands:
-            from .commands.help_command import HelpCommand
-            help_instance = HelpCommand(commands_registry=self._commands)
-            self._commands["help"] = help_instance
+        Returns:
+            Command instance or None if the command is unknown
+        """
+        command = self._commands.get(command_name)
+        if command is None:
+            factory = self._command_factories.get(command_name)
+            if factory is None:
+                return None
+            command = factory()
+            if command is None:
+                return None
+            self._commands[command_name] = command
+        return command
 
     def parse_and_execute(self, user_input: str) -> Optional[str]:
         """Parse user input and execute command.
@@ -75,34 +100,47 @@ class CommandParser:
             user_input: Raw user input string
             
         Returns:
-            Command result (may be "exit" to signal application exit)
+            Command result (may be EXIT_RESULT to signal application exit)
         """
+        console = get_console()
         if not user_input.strip():
             return None
         
-        # Parse command and arguments
-        try:
-            parts = shlex.split(user_input)
-        except ValueError as e:
-            console.print(f"[red]Error parsing command: {e}[/red]")
-            return None
+        # Parse command and arguments. shlex is only needed when the input
+        # contains quotes or escapes; plain input splits identically on whitespace.
+        if '"' not in user_input and "'" not in user_input and "\\" not in user_input:
+            parts = user_input.split()
+        else:
+            try:
+                parts = shlex.split(user_input)
+            except ValueError as e:
+                console.print(f"[red]Error parsing command: {e}[/red]")
+                return None
         
         if not parts:
             return None
         
-        command_name = parts[0].lower()
+        # Commands are usually typed in lowercase already
+        command_name = parts[0]
+        if not command_name.islower():
+            command_name = command_name.lower()
         args = parts[1:] if len(parts) > 1 else []
         
         # Find and execute command
-        command = self._commands.get(command_name)
+        if command_name in self._command_names:
+            command = self.get_command(sys.intern(command_name))
+        else:
+            command = None
         if command is None:
             console.print(f"[red]Unknown command: {command_name}[/red]")
             console.print(f"[dim]Type 'help' for available commands.[/dim]")
             return None
         
+        # Only expected failures are reported here; anything else propagates
+        # to the console main loop's handler
         try:
             return command.execute(args)
-        except Exception as e:
+        except (ZesecError, OSError, ValueError) as e:
             console.print(f"[red]Error executing command: {e}[/red]")
             return None
 
@@ -115,9 +153,21 @@ class CommandParser:
         Returns:
             List of matching command names
         """
-        partial_lower = partial.lower()
-        return [
-            cmd for cmd in self._commands.keys()
-            if cmd.startswith(partial_lower)
-        ]
+        return list(self.iter_command_suggestions(partial))
 
+    def iter_command_suggestions(self, partial: str) -> Iterator[str]:
+        """Iterate over command names starting with a partial input.
+        
+        Args:
+            partial: Partial command name
+            
+        Yields:
+            Matching command names in sorted order
+        """
+        partial_lower = partial.lower()
+        names = self._sorted_names
+        # Matches form a contiguous run in sorted order
+        for i in range(bisect_left(names, partial_lower), len(names)):
+            if not names[i].startswith(partial_lower):
+                break
+            yield names[i]
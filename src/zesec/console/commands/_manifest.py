@@ -0,0 +1,47 @@
+"""Console command manifest.
+
+Generated by tools/generate_command_manifest.py - do not edit by hand.
+"""
+
+# Modules that register commands
+COMMANDS = (
+    ".clean_command",
+    ".encrypt_command",
+    ".file_commands",
+    ".generate_key_command",
+    ".help_command",
+    ".system_commands",
+)
+
+# Command name or alias -> module that registers it
+LAZY_COMMANDS = {
+    "clean": ".clean_command",
+    "clean-dir": ".clean_command",
+    "encrypt": ".encrypt_command",
+    "decrypt": ".encrypt_command",
+    "ls": ".file_commands",
+    "cat": ".file_commands",
+    "pwd": ".file_commands",
+    "cd": ".file_commands",
+    "generate-key": ".generate_key_command",
+    "help": ".help_command",
+    "exit": ".system_commands",
+    "quit": ".system_commands",
+    "clear": ".system_commands",
+}
+
+# Command name -> (description, category, aliases)
+COMMAND_SUMMARIES = {
+    "clean": ("Securely clean a file", "Cleaning", ()),
+    "clean-dir": ("Securely clean directory", "Cleaning", ()),
+    "encrypt": ("Encrypt a file", "Encryption", ()),
+    "decrypt": ("Decrypt a file", "Encryption", ()),
+    "ls": ("List files and directories", "File Operations", ()),
+    "cat": ("Display file contents", "File Operations", ()),
+    "pwd": ("Print current working directory", "File Operations", ()),
+    "cd": ("Change directory", "File Operations", ()),
+    "generate-key": ("Generate encryption key file", "Encryption", ()),
+    "help": ("Show help information", "System", ()),
+    "exit": ("Exit the application", "System", ("quit",)),
+    "clear": ("Clear the screen", "System", ()),
+}
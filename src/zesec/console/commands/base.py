@@ -1,13 +1,39 @@
 """Base command class for all console commands."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Optional, Dict, List, Callable, Type
+from importlib import import_module
+from typing import Optional, Dict, Iterator, List, Callable, NamedTuple, Type
+
+# Result returned by a command to end the console session. Callers compare
+# against it by identity.
+EXIT_RESULT = "exit"
+
+
+class CommandInfo(NamedTuple):
+    """Metadata stored for a registered command."""
+
+    cls: Type["BaseCommand"]
+    description: str
+    category: str
+    aliases: tuple[str, ...]
+    requires_container: bool
+    factory: Optional[Callable]
 
 
 class CommandRegistry:
     """Global registry for auto-discovered commands."""
     
-    _registered_commands: Dict[str, Dict[str, Any]] = {}
+    # Primary command name -> metadata, and alias -> primary command name
+    _registered_commands: Dict[str, CommandInfo] = {}
+    _aliases: Dict[str, str] = {}
+    # Command name or alias -> module that registers it, for commands whose
+    # module has not been imported yet
+    _lazy_modules: Dict[str, str] = {}
+    # Primary command name -> (description, category, aliases) known ahead
+    # of registration, so commands can be listed without importing them
+    _summaries: Dict[str, tuple[str, str, tuple[str, ...]]] = {}
+    # Bumped on every change so callers can cache data derived from the registry
+    _version: int = 0
     
     @classmethod
     def register(
@@ -35,37 +61,111 @@ class CommandRegistry:
                 raise TypeError(f"{command_class.__name__} must extend BaseCommand")
             
             # Store metadata
-            cls._registered_commands[name] = {
-                "class": command_class,
-                "description": description,
-                "category": category,
-                "aliases": aliases or [],
-                "requires_container": requires_container,
-                "factory": factory,
-            }
+            cls._registered_commands[name] = CommandInfo(
+                cls=command_class,
+                description=description,
+                category=category,
+                aliases=tuple(aliases or ()),
+                requires_container=requires_container,
+                factory=factory,
+            )
             
             # Also register aliases
             if aliases:
                 for alias in aliases:
-                    cls._registered_commands[alias] = cls._registered_commands[name]
+                    cls._aliases[alias] = name
             
+            cls._version += 1
             return command_class
         return decorator
     
     @classmethod
-    def get_all_commands(cls) -> Dict[str, Dict[str, Any]]:
-        """Get all registered commands."""
+    def register_lazy(cls, name: str, module: str) -> None:
+        """Register a command whose module is imported on first lookup.
+        
+        The module's @register decorators fill in the real entry when
+        :meth:`get_command_info` first asks for the command.
+        
+        Args:
+            name: Command name or alias
+            module: Module path, relative to this package (e.g. ".clean_command")
+        """
+        cls._lazy_modules[name] = module
+    
+    @classmethod
+    def register_summary(
+        cls,
+        name: str,
+        description: str,
+        category: str,
+        aliases: tuple[str, ...] = ()
+    ) -> None:
+        """Record help metadata for a command that may not be imported yet.
+        
+        Args:
+            name: Primary command name
+            description: Short description for help
+            category: Category for help grouping
+            aliases: Command aliases
+        """
+        cls._summaries[name] = (description, category, aliases)
+        cls._version += 1
+    
+    @classmethod
+    def get_lazy_names(cls) -> list[str]:
+        """Get the names of all lazily registered commands."""
+        return list(cls._lazy_modules)
+    
+    @classmethod
+    def get_all_commands(cls) -> Dict[str, CommandInfo]:
+        """Get all registered commands, keyed by primary name (no aliases)."""
         return cls._registered_commands.copy()
     
     @classmethod
-    def get_command_info(cls, name: str) -> Optional[Dict[str, Any]]:
-        """Get command info by name."""
-        return cls._registered_commands.get(name)
+    def iter_canonical(cls) -> Iterator[tuple[str, CommandInfo]]:
+        """Iterate over registered commands by primary name, without copying."""
+        return iter(cls._registered_commands.items())
+    
+    @classmethod
+    def iter_summaries(cls) -> Iterator[tuple[str, str, str, tuple[str, ...]]]:
+        """Iterate over (name, description, category, aliases) for all commands.
+        
+        Covers registered commands and commands only known from their
+        summary, without importing any command module.
+        """
+        for name, info in cls._registered_commands.items():
+            yield name, info.description, info.category, info.aliases
+        for name, summary in cls._summaries.items():
+            if name not in cls._registered_commands:
+                yield (name, *summary)
+    
+    @classmethod
+    def get_version(cls) -> int:
+        """Get a counter that changes whenever the registry changes."""
+        return cls._version
+    
+    @classmethod
+    def resolve_name(cls, name: str) -> str:
+        """Get the primary command name for a name or alias."""
+        return cls._aliases.get(name, name)
+    
+    @classmethod
+    def get_command_info(cls, name: str) -> Optional[CommandInfo]:
+        """Get command info by name or alias, importing its module if needed."""
+        info = cls._registered_commands.get(cls._aliases.get(name, name))
+        if info is None and name in cls._lazy_modules:
+            import_module(cls._lazy_modules[name], __package__)
+            info = cls._registered_commands.get(cls._aliases.get(name, name))
+        return info
     
     @classmethod
     def clear(cls):
         """Clear registry (mainly for testing)."""
         cls._registered_commands.clear()
+        cls._aliases.clear()
+        cls._lazy_modules.clear()
+        cls._summaries.clear()
+        cls._version += 1
 
 
 class BaseCommand(ABC):
@@ -79,7 +179,7 @@ class BaseCommand(ABC):
             args: Command arguments
             
         Returns:
-            Command result (may be "exit" to signal application exit)
+            Command result (may be EXIT_RESULT to signal application exit)
         """
         pass
 
@@ -1,14 +1,48 @@
 """Clean command implementation."""
 
+import stat
 from pathlib import Path
 from typing import Optional
 
-from rich.console import Console
-from rich.prompt import Confirm
-
+from ...utils.platform import resolve_and_stat
+from .._console import get_console
 from .base import BaseCommand, CommandRegistry
 
-console = Console()
+
+# Help texts, built once at import
+_CLEAN_HELP = """
+            clean <file> [options]
+            
+            Securely clean a file by overwriting with zeros and deleting.
+            
+            Arguments:
+              file    Path to the file to clean
+            
+            Options:
+              --no-delete  Overwrite file but don't delete it
+            
+            Examples:
+              clean document.txt
+              clean /path/to/file.txt
+              clean document.txt --no-delete
+            """
+
+_CLEAN_DIR_HELP = """
+            clean-dir <directory> [options]
+            
+            Securely clean all files in a directory by overwriting and deleting.
+            
+            Arguments:
+              directory    Path to the directory to clean
+            
+            Options:
+              --no-delete  Overwrite files but don't delete them
+            
+            Examples:
+              clean-dir /tmp/old_files
+              clean-dir documents
+              clean-dir /tmp/old_files --no-delete
+            """
 
 
 # Factory function for clean-dir command
@@ -45,6 +79,7 @@ class CleanCommand(BaseCommand):
         Returns:
             None
         """
+        console = get_console()
         if not args:
             cmd_name = "clean-dir" if self._is_directory else "clean"
             console.print(f"[red]Error: {cmd_name} requires a path[/red]")
@@ -64,19 +99,23 @@ class CleanCommand(BaseCommand):
                 i += 1
         
         try:
-            # Resolve path
-            target_path = target_path.resolve()
-            
-            if not target_path.exists():
+            # Resolve path, symlinks included, so the file that gets
+            # overwritten is also the one deleted. One stat serves the
+            # existence and file/directory checks.
+            target_path, st = resolve_and_stat(target_path)
+            if st is None:
                 console.print(f"[red]Path does not exist: {target_path}[/red]")
                 return None
+            mode = st.st_mode
+            
+            from rich.prompt import Confirm
             
             # Get cleaner from container
             cleaner = self._container.cleaner()
             
             if self._is_directory:
                 # Clean directory
-                if not target_path.is_dir():
+                if not stat.S_ISDIR(mode):
                     console.print(f"[red]Not a directory: {target_path}[/red]")
                     return None
                 
@@ -91,7 +130,7 @@ class CleanCommand(BaseCommand):
                 
             else:
                 # Clean single file
-                if not target_path.is_file():
+                if not stat.S_ISREG(mode):
                     console.print(f"[red]Not a file: {target_path}[/red]")
                     return None
                 
@@ -119,40 +158,7 @@ class CleanCommand(BaseCommand):
 
     def get_help(self) -> str:
         """Get help text."""
-        if self._is_directory:
-            return """
-            clean-dir <directory> [options]
-            
-            Securely clean all files in a directory by overwriting and deleting.
-            
-            Arguments:
-              directory    Path to the directory to clean
-            
-            Options:
-              --no-delete  Overwrite files but don't delete them
-            
-            Examples:
-              clean-dir /tmp/old_files
-              clean-dir documents
-              clean-dir /tmp/old_files --no-delete
-            """
-        else:
-            return """
-            clean <file> [options]
-            
-            Securely clean a file by overwriting with zeros and deleting.
-            
-            Arguments:
-              file    Path to the file to clean
-            
-            Options:
-              --no-delete  Overwrite file but don't delete it
-            
-            Examples:
-              clean document.txt
-              clean /path/to/file.txt
-              clean document.txt --no-delete
-            """
+        return _CLEAN_DIR_HELP if self._is_directory else _CLEAN_HELP
 
 
 @CommandRegistry.register(
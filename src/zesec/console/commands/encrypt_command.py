@@ -1,15 +1,43 @@
 """Encrypt command implementation."""
 
+import argparse
 from pathlib import Path
 from typing import Optional
 
-from rich.console import Console
-from rich.prompt import Prompt
-
-from ...interfaces.encryptor_interface import IEncryptor
+from ...utils.platform import resolve_and_stat
+from ...utils.secure_memory import to_secret_buffer, wipe_buffer
+from .._console import get_console
 from .base import BaseCommand, CommandRegistry
 
-console = Console()
+
+class _OptionParser(argparse.ArgumentParser):
+    """Argument parser that reports errors instead of exiting."""
+
+    def error(self, message: str):
+        raise ValueError(message)
+
+
+def _build_parser(prog: str, with_clean_option: bool) -> _OptionParser:
+    """Build the option parser shared by encrypt and decrypt.
+    
+    Args:
+        prog: Command name
+        with_clean_option: Whether to accept --no-clean
+        
+    Returns:
+        Configured parser
+    """
+    parser = _OptionParser(prog=prog, add_help=False)
+    parser.add_argument("file", type=Path)
+    parser.add_argument("--key-file", dest="key_file_path", type=Path, default=None)
+    if with_clean_option:
+        parser.add_argument("--no-clean", dest="clean_original", action="store_false")
+    return parser
+
+
+# Built once at import and reused for every invocation
+_ENCRYPT_PARSER = _build_parser("encrypt", with_clean_option=True)
+_DECRYPT_PARSER = _build_parser("decrypt", with_clean_option=False)
 
 
 @CommandRegistry.register(
@@ -38,40 +66,38 @@ class EncryptCommand(BaseCommand):
         Returns:
             None
         """
+        console = get_console()
         if not args:
             console.print("[red]Error: encrypt requires a file path[/red]")
             console.print("[dim]Usage: encrypt <file> [--key-file <path>] [--no-clean][/dim]")
             return None
         
-        file_path = Path(args[0])
-        
         # Parse options
-        key_file_path = None
-        clean_original = True
-        
-        i = 1
-        while i < len(args):
-            if args[i] == "--key-file" and i + 1 < len(args):
-                key_file_path = Path(args[i + 1])
-                i += 2
-            elif args[i] == "--no-clean":
-                clean_original = False
-                i += 1
-            else:
-                i += 1
+        try:
+            options = _ENCRYPT_PARSER.parse_args(args)
+        except ValueError as e:
+            console.print(f"[red]Error: {e}[/red]")
+            console.print("[dim]Usage: encrypt <file> [--key-file <path>] [--no-clean][/dim]")
+            return None
         
+        file_path = options.file
+        key_file_path = options.key_file_path
+        clean_original = options.clean_original
+        
+        password = bytearray()
         try:
             # Resolve paths
-            file_path = file_path.resolve()
+            file_path, st = resolve_and_stat(file_path)
             if key_file_path:
                 key_file_path = key_file_path.resolve()
             
-            if not file_path.exists():
+            if st is None:
                 console.print(f"[red]File does not exist: {file_path}[/red]")
                 return None
             
-            # Get password
-            password = Prompt.ask("Enter password", password=True)
+            # Get password, kept in a buffer that is wiped when done
+            from rich.prompt import Prompt
+            password = to_secret_buffer(Prompt.ask("Enter password", password=True))
             if not password:
                 console.print("[red]Password cannot be empty[/red]")
                 return None
@@ -96,6 +122,8 @@ class EncryptCommand(BaseCommand):
                 
         except Exception as e:
             console.print(f"[red]Error: {e}[/red]")
+        finally:
+            wipe_buffer(password)
         
         return None
 
@@ -146,36 +174,37 @@ class DecryptCommand(BaseCommand):
         Returns:
             None
         """
+        console = get_console()
         if not args:
             console.print("[red]Error: decrypt requires a file path[/red]")
             console.print("[dim]Usage: decrypt <file> [--key-file <path>][/dim]")
             return None
         
-        file_path = Path(args[0])
-        
         # Parse options
-        key_file_path = None
+        try:
+            options = _DECRYPT_PARSER.parse_args(args)
+        except ValueError as e:
+            console.print(f"[red]Error: {e}[/red]")
+            console.print("[dim]Usage: decrypt <file> [--key-file <path>][/dim]")
+            return None
         
-        i = 1
-        while i < len(args):
-            if args[i] == "--key-file" and i + 1 < len(args):
-                key_file_path = Path(args[i + 1])
-                i += 2
-            else:
-                i += 1
+        file_path = options.file
+        key_file_path = options.key_file_path
         
+        password = bytearray()
         try:
             # Resolve paths
-            file_path = file_path.resolve()
+            file_path, st = resolve_and_stat(file_path)
             if key_file_path:
                 key_file_path = key_file_path.resolve()
             
-            if not file_path.exists():
+            if st is None:
                 console.print(f"[red]File does not exist: {file_path}[/red]")
                 return None
             
-            # Get password
-            password = Prompt.ask("Enter password", password=True)
+            # Get password, kept in a buffer that is wiped when done
+            from rich.prompt import Prompt
+            password = to_secret_buffer(Prompt.ask("Enter password", password=True))
             if not password:
                 console.print("[red]Password cannot be empty[/red]")
                 return None
@@ -199,6 +228,8 @@ class DecryptCommand(BaseCommand):
                 
         except Exception as e:
             console.print(f"[red]Error: {e}[/red]")
+        finally:
+            wipe_buffer(password)
         
         return None
 
@@ -1,17 +1,23 @@
 """File operation commands (ls, cat, pwd, cd) - cross-platform."""
 
+import io
 import os
+import stat
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional, TextIO
 
-from rich.console import Console
-from rich.table import Table
-from rich.tree import Tree
-
-from ...utils.platform import get_platform
+from ...utils.platform import resolve_and_stat
+from .._console import get_console
 from .base import BaseCommand, CommandRegistry
 
-console = Console()
+# cat streams files in chunks of this size; the first block is sniffed for
+# NUL bytes to detect binary files
+_CAT_CHUNK_SIZE = 1024 * 1024
+_BINARY_SNIFF_SIZE = 4096
+
+# Units for ls sizes and the divisor for each
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+_SIZE_DIVISORS = tuple(1 << (10 * i) for i in range(len(_SIZE_UNITS)))
 
 
 @CommandRegistry.register(
@@ -31,20 +37,18 @@ class LsCommand(BaseCommand):
         Returns:
             None
         """
-        # Get target path (default to current directory)
-        target_path = Path(args[0]) if args else Path.cwd()
-        
+        console = get_console()
         try:
-            # Resolve path
-            target_path = target_path.resolve()
+            # Resolve path (default to current directory)
+            target_path, st = resolve_and_stat(args[0] if args else os.curdir)
             
-            if not target_path.exists():
+            if st is None:
                 console.print(f"[red]Path does not exist: {target_path}[/red]")
                 return None
             
-            if target_path.is_file():
+            if stat.S_ISREG(st.st_mode):
                 # Single file
-                self._print_file_info(target_path)
+                self._print_file_info(target_path, st)
             else:
                 # Directory listing
                 self._print_directory(target_path)
@@ -54,12 +58,11 @@ class LsCommand(BaseCommand):
         
         return None
 
-    def _print_file_info(self, file_path: Path) -> None:
+    def _print_file_info(self, file_path: Path, st: os.stat_result) -> None:
         """Print information about a single file."""
+        console = get_console()
         try:
-            stat = file_path.stat()
-            size = stat.st_size
-            size_str = self._format_size(size)
+            size_str = self._format_size(st.st_size)
             
             console.print(f"[cyan]{file_path.name}[/cyan]")
             console.print(f"  Size: {size_str}")
@@ -69,36 +72,43 @@ class LsCommand(BaseCommand):
 
     def _print_directory(self, dir_path: Path) -> None:
         """Print directory contents."""
+        console = get_console()
         try:
-            items = sorted(dir_path.iterdir(), key=lambda x: (x.is_file(), x.name.lower()))
+            # DirEntry caches the file type from the directory read, so the
+            # sort key and type checks below cost no extra stat() calls
+            with os.scandir(dir_path) as it:
+                entries = list(it)
+            entries.sort(key=lambda e: (e.is_file(), e.name.lower()))
             
-            if not items:
+            if not entries:
                 console.print(f"[dim]Directory is empty: {dir_path}[/dim]")
                 return
             
             # Create table for directory listing
+            from rich.table import Table
             table = Table(show_header=True, header_style="bold cyan")
             table.add_column("Type", style="dim", width=6)
             table.add_column("Name", style="cyan")
             table.add_column("Size", justify="right", style="green")
             
-            for item in items:
-                item_type = "[DIR]" if item.is_dir() else "[FILE]"
-                name = item.name
+            for entry in entries:
+                is_file = entry.is_file()
+                item_type = "[DIR]" if entry.is_dir() else "[FILE]"
                 
-                if item.is_file():
+                if is_file:
                     try:
-                        size = item.stat().st_size
-                        size_str = self._format_size(size)
-                    except:
+                        size_str = self._format_size(entry.stat().st_size)
+                    except OSError:
                         size_str = "?"
                 else:
                     size_str = "-"
                 
-                table.add_row(item_type, name, size_str)
+                table.add_row(item_type, entry.name, size_str)
             
-            console.print(f"\n[bold]Contents of: {dir_path}[/bold]")
-            console.print(table)
+            # Header and table in one render pass
+            from rich.console import Group
+            from rich.text import Text
+            console.print(Group(Text(f"\nContents of: {dir_path}", style="bold"), table))
             
         except PermissionError:
             console.print(f"[red]Permission denied: {dir_path}[/red]")
@@ -107,11 +117,11 @@ class LsCommand(BaseCommand):
 
     def _format_size(self, size: int) -> str:
         """Format file size in human-readable format."""
-        for unit in ["B", "KB", "MB", "GB", "TB"]:
-            if size < 1024.0:
-                return f"{size:.1f} {unit}"
-            size /= 1024.0
-        return f"{size:.1f} PB"
+        if size < 1024:
+            return f"{size:.1f} B"
+        # Each unit is 2**10 times the previous one
+        idx = min((size.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+        return f"{size / _SIZE_DIVISORS[idx]:.1f} {_SIZE_UNITS[idx]}"
 
     def get_help(self) -> str:
         """Get help text."""
@@ -147,42 +157,39 @@ class CatCommand(BaseCommand):
         Returns:
             None
         """
+        console = get_console()
         if not args:
             console.print("[red]Error: cat requires a file path[/red]")
             console.print("[dim]Usage: cat <file>[/dim]")
             return None
         
-        file_path = Path(args[0])
-        
         try:
             # Resolve path
-            file_path = file_path.resolve()
+            file_path, st = resolve_and_stat(args[0])
             
-            if not file_path.exists():
+            if st is None:
                 console.print(f"[red]File does not exist: {file_path}[/red]")
                 return None
             
-            if not file_path.is_file():
+            if not stat.S_ISREG(st.st_mode):
                 console.print(f"[red]Not a file: {file_path}[/red]")
                 return None
             
             # Read and display file
             try:
-                with open(file_path, "r", encoding="utf-8", errors="replace") as f:
-                    content = f.read()
+                with open(file_path, "rb", buffering=_CAT_CHUNK_SIZE) as raw:
+                    # NUL bytes in the first block mark a binary file
+                    if b"\0" in raw.peek(_BINARY_SNIFF_SIZE)[:_BINARY_SNIFF_SIZE]:
+                        size = os.fstat(raw.fileno()).st_size
+                        console.print(f"[yellow]Binary file ({size} bytes)[/yellow]")
+                        console.print("[dim]Use a hex viewer for binary files.[/dim]")
+                        return None
+                    
+                    console.print(f"[bold cyan]Contents of: {file_path}[/bold cyan]")
+                    console.print("─" * 60)
+                    self._stream_text(raw, console.file)
+                    console.print("─" * 60)
                     
-                console.print(f"[bold cyan]Contents of: {file_path}[/bold cyan]")
-                console.print("─" * 60)
-                console.print(content)
-                console.print("─" * 60)
-                
-            except UnicodeDecodeError:
-                # Try binary mode for non-text files
-                with open(file_path, "rb") as f:
-                    content = f.read()
-                    size = len(content)
-                    console.print(f"[yellow]Binary file ({size} bytes)[/yellow]")
-                    console.print("[dim]Use a hex viewer for binary files.[/dim]")
             except PermissionError:
                 console.print(f"[red]Permission denied: {file_path}[/red]")
                 
@@ -191,6 +198,29 @@ class CatCommand(BaseCommand):
         
         return None
 
+    def _stream_text(self, raw: BinaryIO, out: TextIO) -> None:
+        """Copy a file's decoded text to the output in fixed-size chunks.
+        
+        The body bypasses Rich, so it is neither held in memory as a whole
+        nor parsed for markup.
+        
+        Args:
+            raw: Binary file object to read from
+            out: Text stream to write to
+        """
+        text = io.TextIOWrapper(raw, encoding="utf-8", errors="replace")
+        last = ""
+        try:
+            while chunk := text.read(_CAT_CHUNK_SIZE):
+                out.write(chunk)
+                last = chunk
+        finally:
+            # The caller's with-block closes the underlying file
+            text.detach()
+        if not last.endswith("\n"):
+            out.write("\n")
+        out.flush()
+
     def get_help(self) -> str:
         """Get help text."""
         return """
@@ -224,6 +254,7 @@ class PwdCommand(BaseCommand):
         Returns:
             None
         """
+        console = get_console()
         try:
             cwd = Path.cwd().resolve()
             console.print(f"[cyan]{cwd}[/cyan]")
@@ -261,21 +292,19 @@ class CdCommand(BaseCommand):
         Returns:
             None
         """
-        if not args:
-            # Go to home directory
-            target = Path.home()
-        else:
-            target = Path(args[0])
+        console = get_console()
+        # Default to home directory
+        target = args[0] if args else Path.home()
         
         try:
             # Resolve path
-            target = target.resolve()
+            target, st = resolve_and_stat(target)
             
-            if not target.exists():
+            if st is None:
                 console.print(f"[red]Directory does not exist: {target}[/red]")
                 return None
             
-            if not target.is_dir():
+            if not stat.S_ISDIR(st.st_mode):
                 console.print(f"[red]Not a directory: {target}[/red]")
                 return None
             
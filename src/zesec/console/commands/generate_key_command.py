@@ -1,16 +1,12 @@
 """Generate key command implementation."""
 
-from pathlib import Path
 from typing import Optional
 
-from rich.console import Console
-
 from ...core.encryption import KeyManager
-from ...core.file_operations import FileHandler
+from ...utils.platform import resolve_and_stat
+from .._console import get_console
 from .base import BaseCommand, CommandRegistry
 
-console = Console()
-
 
 @CommandRegistry.register(
     name="generate-key",
@@ -38,19 +34,18 @@ class GenerateKeyCommand(BaseCommand):
         Returns:
             None
         """
+        console = get_console()
         if not args:
             console.print("[red]Error: generate-key requires a file path[/red]")
             console.print("[dim]Usage: generate-key <path>[/dim]")
             return None
         
-        key_file_path = Path(args[0])
-        
         try:
             # Resolve path
-            key_file_path = key_file_path.resolve()
+            key_file_path, st = resolve_and_stat(args[0])
             
             # Check if file already exists
-            if key_file_path.exists():
+            if st is not None:
                 console.print(f"[yellow]Warning: File already exists: {key_file_path}[/yellow]")
                 response = console.input("Overwrite? (y/N): ")
                 if response.lower() != "y":
@@ -63,7 +58,11 @@ class GenerateKeyCommand(BaseCommand):
             
             # Generate key file
             console.print(f"[cyan]Generating key file: {key_file_path}[/cyan]")
-            success = key_manager.generate_key_file(key_file_path)
+            # Only replace a file the user agreed to overwrite; one that
+            # appeared since the check above is left alone
+            success = key_manager.generate_key_file(
+                key_file_path, overwrite=st is not None
+            )
             
             if success:
                 console.print(f"[green]✓ Key file generated successfully: {key_file_path}[/green]")
@@ -1,13 +1,51 @@
 """Help command implementation."""
 
-from typing import Optional
-
-from rich.console import Console
-from rich.table import Table
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Optional
 
+from .._console import get_console
 from .base import BaseCommand, CommandRegistry
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.table import Table
+    from rich.text import Text
+
+
+@lru_cache(maxsize=1)
+def _build_general_help_table(registry_version: int) -> "Table":
+    """Build the general help table.
+    
+    Cached per registry version, so the table is only rebuilt when commands
+    are registered.
+    
+    Args:
+        registry_version: Current :meth:`CommandRegistry.get_version` value
+        
+    Returns:
+        Table listing all commands grouped by category
+    """
+    # Group commands by category
+    commands_by_category: dict[str, list[tuple[str, str, tuple[str, ...]]]] = {}
+    
+    for name, description, category, aliases in CommandRegistry.iter_summaries():
+        commands_by_category.setdefault(category, []).append((name, description, aliases))
+    
+    # Create a table for better alignment
+    from rich.table import Table
+    table = Table(show_header=False, box=None, padding=(0, 2))
+    table.add_column("Command", style="cyan", width=20)
+    table.add_column("Description", style="white")
+    
+    # Add commands grouped by category
+    for category in sorted(commands_by_category.keys()):
+        table.add_row(f"[bold]{category}:[/bold]", "")
+        for name, description, aliases in sorted(commands_by_category[category]):
+            if aliases:
+                name += f", {', '.join(aliases)}"
+            table.add_row(f"  {name}", description)
+        table.add_row("", "")  # Empty row for spacing
+    
+    return table
 
 
 @CommandRegistry.register(
@@ -18,13 +56,16 @@ console = Console()
 class HelpCommand(BaseCommand):
     """Help command."""
 
-    def __init__(self, commands_registry=None):
+    def __init__(self, command_lookup: Optional[Callable[[str], Optional[BaseCommand]]] = None):
         """Initialize help command.
         
         Args:
-            commands_registry: Optional dict of commands for showing command-specific help
+            command_lookup: Optional callable returning the command for a name,
+                used for showing command-specific help
         """
-        self._commands_registry = commands_registry
+        self._command_lookup = command_lookup
+        # Command name -> help text, built on first request
+        self._help_texts: dict[str, "Text"] = {}
 
     def execute(self, args: list[str]) -> Optional[str]:
         """Execute help command.
@@ -47,41 +88,8 @@ class HelpCommand(BaseCommand):
 
     def _show_general_help(self) -> None:
         """Show general help information."""
-        # Get commands from registry
-        all_commands = CommandRegistry.get_all_commands()
-        
-        # Group commands by category
-        commands_by_category: dict[str, list[dict]] = {}
-        
-        for name, info in all_commands.items():
-            # Skip aliases (they point to the same command)
-            if name in info.get("aliases", []):
-                continue
-            
-            category = info.get("category", "System")
-            if category not in commands_by_category:
-                commands_by_category[category] = []
-            
-            commands_by_category[category].append({
-                "name": name,
-                "description": info.get("description", ""),
-                "aliases": info.get("aliases", [])
-            })
-        
-        # Create a table for better alignment
-        table = Table(show_header=False, box=None, padding=(0, 2))
-        table.add_column("Command", style="cyan", width=20)
-        table.add_column("Description", style="white")
-        
-        # Add commands grouped by category
-        for category in sorted(commands_by_category.keys()):
-            table.add_row(f"[bold]{category}:[/bold]", "")
-            for cmd_info in sorted(commands_by_category[category], key=lambda x: x["name"]):
-                name = cmd_info["name"]
-                if cmd_info["aliases"]:
-                    name += f", {', '.join(cmd_info['aliases'])}"
-                table.add_row(f"  {name}", cmd_info["description"])
-            table.add_row("", "")  # Empty row for spacing
+        console = get_console()
+        table = _build_general_help_table(CommandRegistry.get_version())
         
         # Print the help content directly without a box
         console.print("[bold cyan]Available Commands:[/bold cyan]")
@@ -96,12 +104,20 @@ class HelpCommand(BaseCommand):
         Args:
             command_name: Name of the command
         """
-        if self._commands_registry:
-            command = self._commands_registry.get(command_name)
+        console = get_console()
+        help_text = self._help_texts.get(command_name)
+        if help_text is None and self._command_lookup:
+            command = self._command_lookup(command_name)
             if command:
-                help_text = command.get_help()
-                console.print(help_text)
-                return
+                # Help texts are plain text: wrapping them in Text skips
+                # markup parsing and keeps "[options]" etc. from being
+                # taken as markup tags
+                from rich.text import Text
+                help_text = Text(command.get_help())
+                self._help_texts[command_name] = help_text
+        if help_text is not None:
+            console.print(help_text)
+            return
         
         console.print(f"[red]Unknown command: {command_name}[/red]")
         console.print("[dim]Type 'help' for available commands.[/dim]")
@@ -1,29 +1,62 @@
 """Command loader for loading commands."""
 
-from typing import Dict, Optional, Type
+from importlib import import_module
+from typing import TYPE_CHECKING, Optional, Type
 
-from ...di.container import ApplicationContainer
+from ._manifest import COMMAND_SUMMARIES, COMMANDS, LAZY_COMMANDS
 from .base import BaseCommand, CommandRegistry
 
+if TYPE_CHECKING:
+    from ...di.container import ApplicationContainer
+
+
+# Commands are registered lazily from the generated manifest: a module is
+# imported only when one of its commands is first looked up, so e.g. "exit"
+# never loads cryptography. Their help metadata comes from the manifest too,
+# so listing commands imports nothing. PyInstaller picks these modules up
+# through collect_submodules("zesec") in zesec.spec.
+for _name, _module in LAZY_COMMANDS.items():
+    CommandRegistry.register_lazy(_name, _module)
+for _name, _summary in COMMAND_SUMMARIES.items():
+    CommandRegistry.register_summary(_name, *_summary)
+
+# Container shared by commands created without one
+_DEFAULT_CONTAINER: Optional["ApplicationContainer"] = None
+
+
+def get_default_container() -> "ApplicationContainer":
+    """Get the shared DI container, creating it on first use.
+    
+    Returns:
+        ApplicationContainer instance (created on first call)
+    """
+    global _DEFAULT_CONTAINER
+    if _DEFAULT_CONTAINER is None:
+        from ...di.container import ApplicationContainer
+        _DEFAULT_CONTAINER = ApplicationContainer()
+    return _DEFAULT_CONTAINER
+
+
+def reset_default_container() -> None:
+    """Drop the shared DI container so the next use builds a fresh one."""
+    global _DEFAULT_CONTAINER
+    _DEFAULT_CONTAINER = None
+
 
 def discover_commands(commands_package_path: str = "zesec.console.commands") -> None:
-    """Load and register all commands by directly importing command modules.
+    """Load and register all commands by importing every command module.
     
-    This function directly imports all command modules, which triggers
-    the @CommandRegistry.register decorators.
+    Importing the modules triggers their @CommandRegistry.register
+    decorators. Only needed where every command class must be loaded up
+    front; single commands are loaded on lookup and the help listing uses
+    the manifest's metadata.
     
     Args:
         commands_package_path: Full path to commands package (kept for compatibility)
     """
-    # Directly import all command modules
-    # This ensures they work in both normal Python and PyInstaller frozen executables
     try:
-        from . import clean_command
-        from . import encrypt_command
-        from . import file_commands
-        from . import generate_key_command
-        from . import help_command
-        from . import system_commands
+        for module in COMMANDS:
+            import_module(module, __package__)
     except ImportError as e:
         print(f"Error importing command modules: {e}")
         raise
@@ -31,7 +64,7 @@ def discover_commands(commands_package_path: str = "zesec.console.commands") ->
 
 def create_command_instance(
     command_name: str,
-    container: Optional[ApplicationContainer] = None
+    container: Optional["ApplicationContainer"] = None
 ) -> Optional[BaseCommand]:
     """Create an instance of a registered command.
     
@@ -46,25 +79,23 @@ def create_command_instance(
     if not command_info:
         return None
     
-    command_class: Type[BaseCommand] = command_info["class"]
-    requires_container = command_info.get("requires_container", False)
-    factory = command_info.get("factory")
+    command_class: Type[BaseCommand] = command_info.cls
+    requires_container = command_info.requires_container
+    factory = command_info.factory
+    
+    if requires_container and container is None:
+        container = get_default_container()
     
     # Use factory if provided (for special cases like clean-dir)
     if factory:
-        if requires_container and container:
+        if requires_container:
             return factory(container)
-        elif requires_container:
-            return factory(ApplicationContainer())
         else:
             return factory()
     
     # Instantiate with container if needed
     if requires_container:
-        if container:
-            return command_class(container)
-        else:
-            return command_class(ApplicationContainer())
+        return command_class(container)
     else:
         return command_class()
 
@@ -1,13 +1,15 @@
 """System commands (exit, clear, etc.)."""
 
 import os
+import sys
 from typing import Optional
 
-from rich.console import Console
+from ...utils.platform import enable_ansi_escapes
+from .base import EXIT_RESULT, BaseCommand, CommandRegistry
 
-from .base import BaseCommand, CommandRegistry
-
-console = Console()
+# Cursor home, clear screen, clear scrollback (what `clear` itself emits)
+_ANSI_CLEAR = "\x1b[H\x1b[2J\x1b[3J"
+_CLEAR_CMD = "cls" if os.name == "nt" else "clear"
 
 
 @CommandRegistry.register(
@@ -26,9 +28,9 @@ class ExitCommand(BaseCommand):
             args: Command arguments (ignored)
             
         Returns:
-            "exit" to signal application exit
+            EXIT_RESULT to signal application exit
         """
-        return "exit"
+        return EXIT_RESULT
 
     def get_help(self) -> str:
         """Get help text."""
@@ -60,8 +62,13 @@ class ClearCommand(BaseCommand):
         Returns:
             None
         """
-        # Clear screen (cross-platform)
-        os.system("cls" if os.name == "nt" else "clear")
+        # Clear screen with escape codes; only consoles without VT support
+        # (pre-Windows 10) fall back to spawning a shell
+        if enable_ansi_escapes():
+            sys.stdout.write(_ANSI_CLEAR)
+            sys.stdout.flush()
+        else:
+            os.system(_CLEAR_CMD)
         return None
 
     def get_help(self) -> str:
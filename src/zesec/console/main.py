@@ -2,24 +2,17 @@
 
 import sys
 from pathlib import Path
-from typing import Optional
 
-from prompt_toolkit import PromptSession
-from prompt_toolkit.completion import WordCompleter
-from prompt_toolkit.history import FileHistory
-from rich.console import Console
-
-from ..config.settings import Settings
+from ..config.settings import get_settings
 from ..utils.logging_config import get_logger, setup_logging
+from ._console import get_console
 from .command_parser import CommandParser
-from .commands.base import BaseCommand
-
-# Initialize rich console for output
-rich_console = Console()
+from .commands.base import EXIT_RESULT
 
 
 def print_banner() -> None:
     """Print application banner."""
+    rich_console = get_console()
     # Box width: 41 chars total (╔ + 39 ═ + ╗)
     # Inside space: 39 chars (between ║ characters)
     # Text 1: "ZESEC - Secure File Manager" = 29 chars -> 5 spaces each side
@@ -33,6 +26,7 @@ def print_banner() -> None:
 
 def print_help() -> None:
     """Print help information."""
+    rich_console = get_console()
     help_text = """
     Available Commands:
     
@@ -67,28 +61,30 @@ def main() -> int:
     Returns:
         Exit code (0 for success, non-zero for error)
     """
+    # prompt_toolkit is only needed once the REPL actually starts
+    from prompt_toolkit import PromptSession
+    from prompt_toolkit.history import FileHistory, ThreadedHistory
+
+    from ._completer import CommandCompleter
+    
+    rich_console = get_console()
     # Setup logging
     setup_logging()
     logger = get_logger(__name__)
     
     # Load settings
-    settings = Settings.get_instance()
+    settings = get_settings()
     
     # Initialize command parser
     command_parser = CommandParser()
     
     # Create command completer for autocomplete
-    commands = [
-        "ls", "cat", "pwd", "cd",
-        "encrypt", "decrypt", "generate-key",
-        "clean", "clean-dir",
-        "help", "exit", "quit", "clear",
-    ]
-    completer = WordCompleter(commands, ignore_case=True)
+    completer = CommandCompleter(command_parser)
     
-    # Setup history
+    # Setup history. ThreadedHistory reads the history file on a background
+    # thread, so the first prompt does not wait for it to load.
     history_file = Path.home() / ".zesec_history"
-    history = FileHistory(str(history_file))
+    history = ThreadedHistory(FileHistory(str(history_file)))
     
     # Create prompt session
     session = PromptSession(
@@ -115,7 +111,7 @@ def main() -> int:
                 result = command_parser.parse_and_execute(user_input)
                 
                 # Handle exit
-                if result == "exit":
+                if result is EXIT_RESULT:
                     rich_console.print("[green]Goodbye![/green]")
                     break
                     
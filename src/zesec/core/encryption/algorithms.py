@@ -1,8 +1,9 @@
 """Encryption algorithm definitions and utilities."""
 
 from enum import Enum
-from typing import Protocol
+from typing import Iterable, Iterator, Protocol
 
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
 
@@ -23,12 +24,27 @@ class AlgorithmProvider(Protocol):
         """Decrypt data."""
         ...
 
+    def encrypt_chunks(
+        self, chunks: Iterable[bytes], key: bytes, nonce: bytes
+    ) -> Iterator[bytes]:
+        """Encrypt data chunk by chunk."""
+        ...
+
+    def decrypt_chunks(
+        self, chunks: Iterable[bytes], key: bytes, nonce: bytes, tag: bytes
+    ) -> Iterator[bytes]:
+        """Decrypt data chunk by chunk."""
+        ...
 
-class AES256GCMProvider:
-    """AES-256-GCM encryption provider."""
 
-    def __init__(self):
-        self._cipher = None
+class AES256GCMProvider:
+    """AES-256-GCM encryption provider.
+    
+    Whole buffers use the one-shot ``AESGCM`` AEAD API, which hands the data
+    to OpenSSL in a single call. Large files are streamed through the
+    ``Cipher(AES, GCM)`` context instead, which produces the same output
+    without holding the whole file in memory.
+    """
 
     def encrypt(self, data: bytes, key: bytes, nonce: bytes) -> bytes:
         """Encrypt data using AES-256-GCM.
@@ -58,6 +74,57 @@ class AES256GCMProvider:
         cipher = AESGCM(key)
         return cipher.decrypt(nonce, data, None)
 
+    def encrypt_chunks(
+        self, chunks: Iterable[bytes], key: bytes, nonce: bytes
+    ) -> Iterator[bytes]:
+        """Encrypt data chunk by chunk using AES-256-GCM.
+        
+        The concatenated output is identical to :meth:`encrypt` on the
+        concatenated input.
+        
+        Args:
+            chunks: Plaintext chunks
+            key: Encryption key (32 bytes for AES-256)
+            nonce: Nonce/IV (12 bytes for GCM)
+            
+        Yields:
+            Ciphertext chunks, followed by the authentication tag
+        """
+        encryptor = Cipher(algorithms.AES(key), modes.GCM(nonce)).encryptor()
+        for chunk in chunks:
+            yield encryptor.update(chunk)
+        yield encryptor.finalize() + encryptor.tag
+
+    def decrypt_chunks(
+        self, chunks: Iterable[bytes], key: bytes, nonce: bytes, tag: bytes
+    ) -> Iterator[bytes]:
+        """Decrypt data chunk by chunk using AES-256-GCM.
+        
+        The tag is only verified after the last chunk, so callers must not
+        trust the output until the iterator is exhausted without error.
+        
+        Args:
+            chunks: Ciphertext chunks (without the tag)
+            key: Decryption key (32 bytes for AES-256)
+            nonce: Nonce/IV (12 bytes for GCM)
+            tag: Authentication tag
+            
+        Yields:
+            Plaintext chunks
+            
+        Raises:
+            cryptography.exceptions.InvalidTag: If authentication fails
+        """
+        decryptor = Cipher(algorithms.AES(key), modes.GCM(nonce, tag)).decryptor()
+        for chunk in chunks:
+            yield decryptor.update(chunk)
+        yield decryptor.finalize()
+
+
+# Providers are stateless, so one instance per algorithm is shared by every
+# caller
+_PROVIDERS: dict[EncryptionAlgorithm, AlgorithmProvider] = {}
+
 
 def get_algorithm(algorithm: EncryptionAlgorithm | str) -> AlgorithmProvider:
     """Get algorithm provider for the specified algorithm.
@@ -66,7 +133,7 @@ def get_algorithm(algorithm: EncryptionAlgorithm | str) -> AlgorithmProvider:
         algorithm: Algorithm enum or string name
         
     Returns:
-        Algorithm provider instance
+        Shared algorithm provider instance
         
     Raises:
         ValueError: If algorithm is not supported
@@ -77,8 +144,14 @@ def get_algorithm(algorithm: EncryptionAlgorithm | str) -> AlgorithmProvider:
         except ValueError:
             raise ValueError(f"Unsupported algorithm: {algorithm}")
 
+    provider = _PROVIDERS.get(algorithm)
+    if provider is not None:
+        return provider
+
     if algorithm == EncryptionAlgorithm.AES_256_GCM:
-        return AES256GCMProvider()
+        provider = AES256GCMProvider()
     else:
         raise ValueError(f"Algorithm provider not implemented: {algorithm}")
 
+    return _PROVIDERS.setdefault(algorithm, provider)
+
@@ -1,19 +1,29 @@
 """Core encryption service implementation."""
 
+import os
 import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from functools import partial
+from itertools import chain
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, Iterator, Optional
 
-from ...config.settings import Settings
+from ...config.settings import get_settings
+from ...core.file_operations.path_utils import iter_files
 from ...core.models.encryption_result import EncryptionResult
 from ...interfaces.cleaner_interface import ICleaner
-from ...interfaces.encryptor_interface import IEncryptor
 from ...interfaces.file_handler_interface import IFileHandler
+from ...utils.cancellation import raise_if_cancelled
 from ...utils.exceptions import DecryptionError, EncryptionError
 from ...utils.logging_config import get_logger
 from .algorithms import EncryptionAlgorithm, get_algorithm
 from .key_manager import KeyManager
 
+if TYPE_CHECKING:
+    from ...config.settings import Settings
+
 
 class EncryptorService:
     """Core encryption service - pure business logic.
@@ -30,22 +40,37 @@ class EncryptorService:
     # - Salt length: 1 byte
     # - Nonce length: 1 byte
     # - Key file flag: 1 byte (0 = no key file, 1 = key file used)
-    # - Reserved: 11 bytes
+    # - KDF hash ID: 1 byte (0 = SHA-256, 1 = SHA-512; always 0 in version 1)
+    # - Reserved: 10 bytes
     # [Salt: variable (typically 16 bytes)]
     # [Nonce: variable (typically 12 bytes)]
     # [Ciphertext + Tag: variable]
 
+    # Files keyed with the default SHA-256 KDF keep version 1, so older
+    # releases can still read them; other KDF hashes need version 2, which
+    # older releases reject instead of deriving the wrong key
     FILE_FORMAT_VERSION = 1
+    FILE_FORMAT_VERSION_KDF_HASH = 2
     ALGORITHM_ID_AES_256_GCM = 1
     KEY_FILE_FLAG_NO_KEY = 0
     KEY_FILE_FLAG_WITH_KEY = 1
+    KDF_HASH_IDS = {"SHA-256": 0, "SHA-512": 1}
+    _KDF_HASH_NAMES = {hash_id: name for name, hash_id in KDF_HASH_IDS.items()}
+
+    # Precompiled header layouts: the full header, and the fields read back
+    _HEADER_STRUCT = struct.Struct("!BBBBBB10s")
+    _HEADER_PREFIX = struct.Struct("!BBBBBB")
+
+    # Files at least this large are streamed through the cipher in
+    # BUFFER_SIZE chunks instead of being encrypted in one call
+    STREAMING_THRESHOLD = 4 * 1024 * 1024
 
     def __init__(
         self,
         key_manager: KeyManager,
         file_handler: IFileHandler,
         cleaner: Optional[ICleaner] = None,
-        settings: Optional[Settings] = None,
+        settings: Optional["Settings"] = None,
         logger=None,
     ):
         """Initialize EncryptorService.
@@ -60,39 +85,105 @@ class EncryptorService:
         self._key_manager = key_manager
         self._file_handler = file_handler
         self._cleaner = cleaner
-        self._settings = settings or Settings.get_instance()
+        self._settings = settings or get_settings()
         self._logger = logger or get_logger(__name__)
 
         # Get algorithm provider
         algorithm = EncryptionAlgorithm(self._settings.ENCRYPTION_ALGORITHM)
         self._algorithm = get_algorithm(algorithm)
 
+        # KDF hash for new files (validated when a key is derived)
+        self._kdf_hash = self._settings.KDF_HASH
+
     def encrypt_file(
         self,
         file_path: Path,
-        password: str,
+        password: str | bytearray,
         output_path: Optional[Path] = None,
         clean_original: bool = True,
         key_file_path: Optional[Path] = None,
+        cancel: Optional[threading.Event] = None,
     ) -> EncryptionResult:
         """Encrypt a file.
         
         Args:
             file_path: Path to the file to encrypt
-            password: Password for encryption
+            password: Password for encryption (text or UTF-8 buffer)
             output_path: Optional output path. If None, uses file_path with .zesec extension
             clean_original: If True, securely clean original file after encryption
             key_file_path: Optional path to key file. If provided, combines with password
+            cancel: Optional event; once set, encryption stops without leaving
+                a partial output file
             
         Returns:
             EncryptionResult with success status and output path
         """
-        try:
-            self._logger.info(f"Starting encryption: {file_path}")
+        self._logger.info(f"Starting encryption: {file_path}")
+        return self._encrypt_file_with_key(
+            file_path,
+            partial(self._derive_encryption_key, password, key_file_path),
+            output_path=output_path,
+            clean_original=clean_original,
+            cancel=cancel,
+        )
+
+    def _derive_encryption_key(
+        self,
+        password: str | bytearray,
+        key_file_path: Optional[Path] = None,
+    ) -> tuple[bytes, bytes, bool]:
+        """Derive the encryption key for a new file.
+        
+        Args:
+            password: Password for encryption (text or UTF-8 buffer)
+            key_file_path: Optional path to key file. If provided, combines with password
+            
+        Returns:
+            Tuple of (encryption key, salt, whether a key file was used)
+        """
+        if self._kdf_hash not in self.KDF_HASH_IDS:
+            raise EncryptionError(f"Unsupported KDF hash: {self._kdf_hash}")
+
+        # Derive key from password
+        password_key, salt = self._key_manager.derive_key_from_password(
+            password, hash_name=self._kdf_hash
+        )
 
-            # Validate input
-            if not self._file_handler.file_exists(file_path):
-                raise EncryptionError(f"File not found: {file_path}")
+        # Load key file if provided
+        key_file = None
+        if key_file_path is not None:
+            self._logger.info(f"Using key file: {key_file_path}")
+            key_file = self._key_manager.load_key_file(key_file_path)
+
+        # Combine keys (key file + password)
+        encryption_key = self._key_manager.combine_keys(key_file, password_key, salt)
+        return encryption_key, salt, key_file is not None
+
+    def _encrypt_file_with_key(
+        self,
+        file_path: Path,
+        derive_key: Callable[[], tuple[bytes, bytes, bool]],
+        output_path: Optional[Path] = None,
+        clean_original: bool = True,
+        cancel: Optional[threading.Event] = None,
+    ) -> EncryptionResult:
+        """Encrypt a file with a key supplied by the caller.
+        
+        Args:
+            file_path: Path to the file to encrypt
+            derive_key: Returns (encryption key, salt, whether a key file was
+                used), like :meth:`_derive_encryption_key`. Only called once
+                the file has been opened, so a missing file is reported
+                without running the KDF first.
+            output_path: Optional output path. If None, uses file_path with .zesec extension
+            clean_original: If True, securely clean original file after encryption
+            cancel: Optional event checked between chunks
+            
+        Returns:
+            EncryptionResult with success status and output path
+        """
+        try:
+            raise_if_cancelled(cancel)
 
             # Determine output path
             if output_path is None:
@@ -100,33 +191,38 @@ class EncryptorService:
             else:
                 self._file_handler.ensure_directory(output_path.parent)
 
-            # Read file
-            plaintext = self._file_handler.read_file(file_path)
-            file_size = len(plaintext)
-
-            # Derive key from password
-            password_key, salt = self._key_manager.derive_key_from_password(password)
-            nonce = self._key_manager.generate_nonce()
-
-            # Load key file if provided
-            key_file = None
-            if key_file_path is not None:
-                self._logger.info(f"Using key file: {key_file_path}")
-                key_file = self._key_manager.load_key_file(key_file_path)
-
-            # Combine keys (key file + password)
-            encryption_key = self._key_manager.combine_keys(key_file, password_key, salt)
-
-            # Encrypt data
-            ciphertext = self._algorithm.encrypt(plaintext, encryption_key, nonce)
-
-            # Build encrypted file format
-            has_key_file = key_file is not None
-            encrypted_data = self._build_encrypted_file(salt, nonce, ciphertext, has_key_file)
-
-            # Write encrypted file
-            if not self._file_handler.write_file(output_path, encrypted_data):
-                raise EncryptionError(f"Failed to write encrypted file: {output_path}")
+            # Read and encrypt file. Large files are memory-mapped so the
+            # cipher reads them directly and are encrypted chunk by chunk; the
+            # mapping is released before the original is cleaned below. The
+            # header and ciphertext are written one after the other rather
+            # than concatenated into a second copy of the file. The output
+            # only appears once complete, so a cancelled or failed run
+            # leaves nothing behind.
+            with ExitStack() as stack:
+                try:
+                    plaintext = stack.enter_context(self._file_handler.map_file(file_path))
+                except FileNotFoundError as e:
+                    raise EncryptionError(f"File not found: {file_path}") from e
+
+                encryption_key, salt, has_key_file = derive_key()
+
+                # Every file gets a fresh nonce, even when the key is shared
+                nonce = self._key_manager.generate_nonce()
+
+                header = self._build_file_header(salt, nonce, has_key_file)
+
+                file_size = len(plaintext)
+                if file_size < self.STREAMING_THRESHOLD:
+                    ciphertext_chunks = (
+                        self._algorithm.encrypt(plaintext, encryption_key, nonce),
+                    )
+                else:
+                    ciphertext_chunks = self._algorithm.encrypt_chunks(
+                        self._iter_chunks(plaintext, cancel), encryption_key, nonce
+                    )
+                self._file_handler.write_stream(
+                    output_path, chain((header,), ciphertext_chunks), atomic=True
+                )
 
             # Clean original file if requested
             if clean_original and self._cleaner:
@@ -154,17 +250,20 @@ class EncryptorService:
     def decrypt_file(
         self,
         file_path: Path,
-        password: str,
+        password: str | bytearray,
         output_path: Optional[Path] = None,
         key_file_path: Optional[Path] = None,
+        cancel: Optional[threading.Event] = None,
     ) -> EncryptionResult:
         """Decrypt a file.
         
         Args:
             file_path: Path to the encrypted file
-            password: Password used for encryption
+            password: Password used for encryption (text or UTF-8 buffer)
             output_path: Optional output path. If None, removes .zesec extension
             key_file_path: Optional path to key file. Required if used during encryption
+            cancel: Optional event; once set, decryption stops without leaving
+                a partial output file
             
         Returns:
             EncryptionResult with success status and output path
@@ -172,50 +271,77 @@ class EncryptorService:
         try:
             self._logger.info(f"Starting decryption: {file_path}")
 
-            # Validate input
-            if not self._file_handler.file_exists(file_path):
-                raise DecryptionError(f"File not found: {file_path}")
-
-            # Read encrypted file
-            encrypted_data = self._file_handler.read_file(file_path)
-
-            # Parse file format
-            salt, nonce, ciphertext, has_key_file = self._parse_encrypted_file(encrypted_data)
-
-            # Check if key file is required
-            if has_key_file and key_file_path is None:
-                raise DecryptionError(
-                    "Key file is required for decryption but not provided. "
-                    "This file was encrypted with a key file."
+            # Read encrypted file (memory-mapped if large). Opening it is
+            # also the existence check.
+            with ExitStack() as stack:
+                try:
+                    encrypted_data = stack.enter_context(
+                        self._file_handler.map_file(file_path)
+                    )
+                except FileNotFoundError as e:
+                    raise DecryptionError(f"File not found: {file_path}") from e
+
+                # Parse file format
+                salt, nonce, ciphertext, has_key_file, kdf_hash = self._parse_encrypted_file(
+                    encrypted_data
                 )
 
-            # Derive key from password
-            password_key, _ = self._key_manager.derive_key_from_password(password, salt)
+                # Check if key file is required
+                if has_key_file and key_file_path is None:
+                    raise DecryptionError(
+                        "Key file is required for decryption but not provided. "
+                        "This file was encrypted with a key file."
+                    )
 
-            # Load key file if required
-            key_file = None
-            if has_key_file:
-                if key_file_path is None:
-                    raise DecryptionError("Key file path required but not provided")
-                self._logger.info(f"Loading key file: {key_file_path}")
-                key_file = self._key_manager.load_key_file(key_file_path)
-
-            # Combine keys (same as encryption)
-            decryption_key = self._key_manager.combine_keys(key_file, password_key, salt)
-
-            # Decrypt data
-            plaintext = self._algorithm.decrypt(ciphertext, decryption_key, nonce)
-            file_size = len(plaintext)
-
-            # Determine output path
-            if output_path is None:
-                output_path = self._settings.get_decrypted_path(file_path)
-            else:
-                self._file_handler.ensure_directory(output_path.parent)
+                # Derive key from password
+                password_key, _ = self._key_manager.derive_key_from_password(
+                    password, salt, hash_name=kdf_hash
+                )
 
-            # Write decrypted file
-            if not self._file_handler.write_file(output_path, plaintext):
-                raise DecryptionError(f"Failed to write decrypted file: {output_path}")
+                # Load key file if required
+                key_file = None
+                if has_key_file:
+                    if key_file_path is None:
+                        raise DecryptionError("Key file path required but not provided")
+                    self._logger.info(f"Loading key file: {key_file_path}")
+                    key_file = self._key_manager.load_key_file(key_file_path)
+
+                # Combine keys (same as encryption)
+                decryption_key = self._key_manager.combine_keys(key_file, password_key, salt)
+
+                # Determine output path
+                if output_path is None:
+                    output_path = self._settings.get_decrypted_path(file_path)
+                else:
+                    self._file_handler.ensure_directory(output_path.parent)
+
+                raise_if_cancelled(cancel)
+
+                if len(ciphertext) < self.STREAMING_THRESHOLD:
+                    # Decrypt data
+                    plaintext = self._algorithm.decrypt(ciphertext, decryption_key, nonce)
+                    file_size = len(plaintext)
+
+                    # Write decrypted file
+                    if not self._file_handler.write_file(output_path, plaintext):
+                        raise DecryptionError(f"Failed to write decrypted file: {output_path}")
+                else:
+                    # Stream the plaintext out. The tag is only checked at the
+                    # end, so write to a temporary file that is moved into
+                    # place only once authentication has succeeded.
+                    tag_size = self._settings.TAG_SIZE
+                    tag = bytes(ciphertext[-tag_size:])
+                    file_size = len(ciphertext) - tag_size
+                    plaintext_chunks = self._algorithm.decrypt_chunks(
+                        self._iter_chunks(ciphertext[:-tag_size], cancel),
+                        decryption_key,
+                        nonce,
+                        tag,
+                    )
+                    self._file_handler.write_stream(output_path, plaintext_chunks, atomic=True)
+
+                # Drop views into the file data so the mapping can be closed
+                del ciphertext
 
             self._logger.success(f"Decryption completed: {output_path}")
 
@@ -237,19 +363,22 @@ class EncryptorService:
     def encrypt_directory(
         self,
         dir_path: Path,
-        password: str,
+        password: str | bytearray,
         clean_originals: bool = True,
         recursive: bool = True,
         key_file_path: Optional[Path] = None,
+        cancel: Optional[threading.Event] = None,
     ) -> list[EncryptionResult]:
         """Encrypt all files in a directory.
         
         Args:
             dir_path: Path to the directory
-            password: Password for encryption
+            password: Password for encryption (text or UTF-8 buffer)
             clean_originals: If True, securely clean original files
             recursive: If True, process subdirectories
             key_file_path: Optional path to key file. If provided, combines with password
+            cancel: Optional event; once set, files not yet encrypted fail
+                as cancelled
             
         Returns:
             List of EncryptionResult for each file processed
@@ -260,99 +389,171 @@ class EncryptorService:
             self._logger.error(f"Not a directory: {dir_path}")
             return results
 
-        # Find all files
-        pattern = "**/*" if recursive else "*"
-        files = [f for f in dir_path.glob(pattern) if f.is_file()]
+        # Find all files, sorted so results and logs follow the same order
+        # on every run
+        files = sorted(iter_files(dir_path, recursive))
 
         self._logger.info(f"Found {len(files)} files to encrypt in {dir_path}")
+        if not files:
+            return results
 
-        for file_path in files:
-            result = self.encrypt_file(
+        # Derive the key once for the whole directory: the KDF is deliberately
+        # slow, and files stay independent through their per-file nonces
+        try:
+            derived = self._derive_encryption_key(password, key_file_path)
+        except Exception as e:
+            self._logger.error(f"Encryption failed: {e}")
+            return [
+                EncryptionResult(success=False, error=str(e), operation="encrypt")
+                for _ in files
+            ]
+
+        def encrypt_one(file_path: Path) -> EncryptionResult:
+            self._logger.info(f"Starting encryption: {file_path}")
+            return self._encrypt_file_with_key(
                 file_path,
-                password,
+                lambda: derived,
                 clean_original=clean_originals,
-                key_file_path=key_file_path,
+                cancel=cancel,
             )
-            results.append(result)
 
+        # Files are independent, and OpenSSL releases the GIL while
+        # encrypting, so threads spread the work across cores. map() yields
+        # results in file order however the threads finish, so failures are
+        # reported here in that order too.
+        max_workers = min(len(files), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            for file_path, result in zip(files, pool.map(encrypt_one, files)):
+                if not result.success:
+                    self._logger.warning(f"Not encrypted: {file_path} ({result.error})")
+                results.append(result)
+
+        succeeded = sum(1 for result in results if result.success)
+        self._logger.info(f"Encrypted {succeeded} of {len(files)} files in {dir_path}")
         return results
 
-    def _build_encrypted_file(
+    def _iter_chunks(
+        self,
+        data: bytes | memoryview,
+        cancel: Optional[threading.Event] = None,
+    ) -> Iterator[memoryview]:
+        """Split data into BUFFER_SIZE chunks without copying.
+        
+        Args:
+            data: Data to split
+            cancel: Optional event checked before each chunk
+            
+        Yields:
+            Consecutive views into data
+            
+        Raises:
+            OperationCancelledError: If cancel is set
+        """
+        view = memoryview(data)
+        chunk_size = self._settings.BUFFER_SIZE
+        for offset in range(0, len(view), chunk_size):
+            raise_if_cancelled(cancel)
+            yield view[offset : offset + chunk_size]
+
+    def _build_file_header(
         self,
         salt: bytes,
         nonce: bytes,
-        ciphertext: bytes,
         has_key_file: bool = False,
     ) -> bytes:
-        """Build encrypted file format.
+        """Build the part of the encrypted file format before the ciphertext.
+        
+        The ciphertext is written after this prefix by the caller, so the
+        full file is never assembled in memory.
         
         Args:
             salt: Salt used for key derivation
             nonce: Nonce used for encryption
-            ciphertext: Encrypted data (includes tag for GCM)
             has_key_file: Whether a key file was used in encryption
             
         Returns:
-            Complete encrypted file as bytes
+            Header, salt and nonce as bytes
         """
-        # Header: version(1) + algorithm(1) + salt_len(1) + nonce_len(1) + key_file_flag(1) + reserved(11)
+        # Header: version(1) + algorithm(1) + salt_len(1) + nonce_len(1) + key_file_flag(1)
+        # + kdf_hash(1) + reserved(10)
         key_file_flag = (
             self.KEY_FILE_FLAG_WITH_KEY if has_key_file else self.KEY_FILE_FLAG_NO_KEY
         )
-        header = struct.pack(
-            "!BBBBB11s",
-            self.FILE_FORMAT_VERSION,
+        kdf_hash_id = self.KDF_HASH_IDS[self._kdf_hash]
+        version = (
+            self.FILE_FORMAT_VERSION if kdf_hash_id == 0 else self.FILE_FORMAT_VERSION_KDF_HASH
+        )
+        header_size = self._HEADER_STRUCT.size
+        salt_end = header_size + len(salt)
+        out = bytearray(salt_end + len(nonce))
+        self._HEADER_STRUCT.pack_into(
+            out,
+            0,
+            version,
             self.ALGORITHM_ID_AES_256_GCM,
             len(salt),
             len(nonce),
             key_file_flag,
-            b"\x00" * 11,  # Reserved
+            kdf_hash_id,
+            b"\x00" * 10,  # Reserved
         )
+        out[header_size:salt_end] = salt
+        out[salt_end:] = nonce
 
-        return header + salt + nonce + ciphertext
+        return bytes(out)
 
     def _parse_encrypted_file(
         self,
-        data: bytes,
-    ) -> tuple[bytes, bytes, bytes, bool]:
+        data: bytes | memoryview,
+    ) -> tuple[bytes, bytes, memoryview, bool, str]:
         """Parse encrypted file format.
         
+        The ciphertext is returned as a view into ``data`` rather than a
+        copy, so the caller must release it before ``data`` is closed.
+        
         Args:
             data: Complete encrypted file data
             
         Returns:
-            Tuple of (salt, nonce, ciphertext, has_key_file)
+            Tuple of (salt, nonce, ciphertext, has_key_file, kdf_hash)
             
         Raises:
             DecryptionError: If file format is invalid
         """
-        if len(data) < 16:
+        if len(data) < self._HEADER_STRUCT.size:
             raise DecryptionError("Encrypted file too short (missing header)")
 
+        mv = memoryview(data)
+
         # Parse header
-        header = data[:16]
-        version, algorithm_id, salt_len, nonce_len, key_file_flag = struct.unpack(
-            "!BBBBB", header[:5]
+        version, algorithm_id, salt_len, nonce_len, key_file_flag, kdf_hash_id = (
+            self._HEADER_PREFIX.unpack_from(mv, 0)
         )
 
-        if version != self.FILE_FORMAT_VERSION:
+        if version == self.FILE_FORMAT_VERSION:
+            kdf_hash_id = 0
+        elif version != self.FILE_FORMAT_VERSION_KDF_HASH:
             raise DecryptionError(f"Unsupported file format version: {version}")
 
+        kdf_hash = self._KDF_HASH_NAMES.get(kdf_hash_id)
+        if kdf_hash is None:
+            raise DecryptionError(f"Unsupported KDF hash ID: {kdf_hash_id}")
+
         if algorithm_id != self.ALGORITHM_ID_AES_256_GCM:
             raise DecryptionError(f"Unsupported algorithm ID: {algorithm_id}")
 
         has_key_file = key_file_flag == self.KEY_FILE_FLAG_WITH_KEY
 
         # Extract components
-        offset = 16
-        salt = data[offset : offset + salt_len]
+        offset = self._HEADER_STRUCT.size
+        salt = bytes(mv[offset : offset + salt_len])
         offset += salt_len
-        nonce = data[offset : offset + nonce_len]
+        nonce = bytes(mv[offset : offset + nonce_len])
         offset += nonce_len
-        ciphertext = data[offset:]
+        ciphertext = mv[offset:]
 
         if len(salt) != salt_len or len(nonce) != nonce_len:
             raise DecryptionError("Invalid file format: component length mismatch")
 
-        return salt, nonce, ciphertext, has_key_file
+        return salt, nonce, ciphertext, has_key_file, kdf_hash
 
@@ -1,18 +1,126 @@
 """Key generation and derivation management."""
 
 import base64
+import binascii
+import ctypes
+import ctypes.util
 import os
+from functools import cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, Optional
 
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+from cryptography.hazmat.primitives import hashes, hmac
+from cryptography.hazmat.primitives.kdf.hkdf import HKDFExpand
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
-from ...config.settings import Settings
+from ...config.settings import get_settings
 from ...interfaces.file_handler_interface import IFileHandler
 from ...utils.exceptions import KeyDerivationError
 from ...utils.logging_config import get_logger
+from ...utils.platform import has_sha_ni
+
+if TYPE_CHECKING:
+    from ...config.settings import Settings
+
+
+# Bytes allowed in a key file beyond the base64 key (newlines, whitespace)
+_KEY_FILE_SLACK = 64
+
+# Hash functions supported for PBKDF2, by setting name
+KDF_HASHES = {
+    "SHA-256": hashes.SHA256,
+    "SHA-512": hashes.SHA512,
+}
+
+
+@cache
+def _check_sha_ni() -> None:
+    """Warn once if an x86 CPU lacks the SHA extensions.
+    
+    OpenSSL uses SHA-NI for SHA-256 whenever the CPU has it; without it,
+    PBKDF2 and HKDF run on the much slower generic SHA-256 code.
+    """
+    if has_sha_ni() is False:
+        get_logger(__name__).warning(
+            "CPU has no SHA extensions (sha_ni); "
+            "key derivation uses the slower generic SHA-256 "
+            "(KDF_HASH=SHA-512 may be faster on this CPU)"
+        )
+
+
+@cache
+def _load_fastpbkdf2(hash_name: str) -> Optional[Callable]:
+    """Load fastpbkdf2_hmac_<hash> from libfastpbkdf2, if installed.
+    
+    fastpbkdf2 keys the HMAC state once and reuses it for every iteration,
+    roughly halving the hashing work of a generic PBKDF2 loop.
+    
+    Args:
+        hash_name: Hash name from KDF_HASHES
+        
+    Returns:
+        The C function, or None if the library is not available
+    """
+    library = ctypes.util.find_library("fastpbkdf2")
+    if library is None:
+        return None
+    symbol = "fastpbkdf2_hmac_" + hash_name.replace("-", "").lower()
+    try:
+        # Loaded through CDLL rather than PyDLL so the GIL is released for
+        # the whole derivation, like cryptography's own PBKDF2
+        func = getattr(ctypes.CDLL(library), symbol)
+    except (OSError, AttributeError):
+        return None
+    func.argtypes = [
+        ctypes.c_void_p, ctypes.c_size_t,  # password
+        ctypes.c_void_p, ctypes.c_size_t,  # salt
+        ctypes.c_uint32,                   # iterations
+        ctypes.c_void_p, ctypes.c_size_t,  # output
+    ]
+    func.restype = None
+    return func
+
+
+def _pbkdf2(
+    password: bytes | bytearray,
+    salt: bytes,
+    iterations: int,
+    length: int,
+    hash_name: str = "SHA-256",
+) -> bytes:
+    """Derive a key with PBKDF2-HMAC.
+    
+    Uses libfastpbkdf2 when available and cryptography's PBKDF2HMAC otherwise;
+    both produce the same key.
+    
+    Args:
+        password: Password bytes
+        salt: Salt bytes
+        iterations: Iteration count
+        length: Derived key length in bytes
+        hash_name: Hash name from KDF_HASHES
+        
+    Returns:
+        Derived key
+    """
+    fast = _load_fastpbkdf2(hash_name)
+    if fast is None:
+        kdf = PBKDF2HMAC(
+            algorithm=KDF_HASHES[hash_name](),
+            length=length,
+            salt=salt,
+            iterations=iterations,
+        )
+        return kdf.derive(password)
+
+    # A bytearray is passed in place, so the password is never copied
+    if isinstance(password, bytearray):
+        password_arg = (ctypes.c_char * len(password)).from_buffer(password)
+    else:
+        password_arg = password
+    out = ctypes.create_string_buffer(length)
+    fast(password_arg, len(password), salt, len(salt), iterations, out, length)
+    return out.raw
 
 
 class KeyManager:
@@ -21,7 +129,7 @@ class KeyManager:
     def __init__(
         self,
         file_handler: Optional[IFileHandler] = None,
-        settings: Optional[Settings] = None,
+        settings: Optional["Settings"] = None,
         logger=None,
     ):
         """Initialize KeyManager.
@@ -32,8 +140,9 @@ class KeyManager:
             logger: Logger instance (defaults to module logger)
         """
         self._file_handler = file_handler
-        self._settings = settings or Settings.get_instance()
+        self._settings = settings or get_settings()
         self._logger = logger or get_logger(__name__)
+        _check_sha_ni()
 
     def generate_key(self) -> bytes:
         """Generate a random encryption key.
@@ -45,29 +154,38 @@ class KeyManager:
 
     def derive_key_from_password(
         self,
-        password: str,
+        password: str | bytearray,
         salt: Optional[bytes] = None,
+        hash_name: Optional[str] = None,
     ) -> tuple[bytes, bytes]:
         """Derive encryption key from password using PBKDF2.
         
         Args:
-            password: User password
+            password: User password, as text or UTF-8 encoded buffer
             salt: Optional salt. If None, generates a random salt
+            hash_name: PBKDF2 hash from KDF_HASHES. If None, uses the
+                KDF_HASH setting
             
         Returns:
             Tuple of (key, salt) where key is derived key and salt is used salt
         """
         if salt is None:
             salt = os.urandom(16)  # 16 bytes salt
+        if hash_name is None:
+            hash_name = self._settings.KDF_HASH
 
         try:
-            kdf = PBKDF2HMAC(
-                algorithm=hashes.SHA256(),
-                length=self._settings.KEY_SIZE,
-                salt=salt,
-                iterations=self._settings.KEY_DERIVATION_ITERATIONS,
+            if hash_name not in KDF_HASHES:
+                raise ValueError(f"Unsupported KDF hash: {hash_name}")
+            if isinstance(password, str):
+                password = password.encode("utf-8")
+            key = _pbkdf2(
+                password,
+                salt,
+                self._settings.KEY_DERIVATION_ITERATIONS,
+                self._settings.KEY_SIZE,
+                hash_name,
             )
-            key = kdf.derive(password.encode("utf-8"))
             return key, salt
         except Exception as e:
             self._logger.error(f"Key derivation failed: {e}")
@@ -81,16 +199,22 @@ class KeyManager:
         """
         return os.urandom(self._settings.NONCE_SIZE)
 
-    def generate_key_file(self, key_file_path: Path) -> bool:
+    def generate_key_file(self, key_file_path: Path, overwrite: bool = True) -> bool:
         """Generate and save a random encryption key to a file.
         
-        The key is saved as base64-encoded text (UTF-8) for human readability.
+        The key is saved as base64-encoded text (UTF-8), or as raw bytes if
+        the KEY_FILE_RAW setting is on.
         
         Args:
             key_file_path: Path where the key file should be saved
+            overwrite: If False, never replace an existing file. The check
+                happens as part of creating the file, so it cannot race.
             
         Returns:
             True if successful, False otherwise
+            
+        Raises:
+            FileExistsError: If overwrite is False and the file already exists
         """
         try:
             if self._file_handler is None:
@@ -99,17 +223,24 @@ class KeyManager:
             # Generate random key
             key = self.generate_key()
 
-            # Encode key as base64 for human readability (UTF-8)
-            key_base64 = base64.b64encode(key).decode('utf-8')
-            
-            # Save key to file as UTF-8 encoded bytes
-            key_bytes = key_base64.encode('utf-8')
-            if not self._file_handler.write_file(key_file_path, key_bytes):
-                raise KeyDerivationError(f"Failed to write key file: {key_file_path}")
+            if self._settings.KEY_FILE_RAW:
+                key_bytes = key
+            else:
+                # Encode key as base64 for human readability (UTF-8)
+                key_bytes = base64.b64encode(key)
+            # Written atomically (or exclusively): a failed write never leaves
+            # a truncated key file behind. An exclusive write creates the file
+            # owner-only; a replacement keeps the old file's permissions.
+            self._file_handler.write_stream(
+                key_file_path, (key_bytes,), atomic=True, exclusive=not overwrite
+            )
 
             self._logger.info(f"Key file generated: {key_file_path}")
             return True
 
+        except FileExistsError:
+            self._logger.error(f"Key file already exists: {key_file_path}")
+            raise
         except Exception as e:
             self._logger.error(f"Failed to generate key file: {e}")
             return False
@@ -117,7 +248,9 @@ class KeyManager:
     def load_key_file(self, key_file_path: Path) -> bytes:
         """Load encryption key from a file.
         
-        The key file is expected to be base64-encoded text (UTF-8).
+        The key file holds either the raw key bytes or the key as
+        base64-encoded text (UTF-8). The two cannot be confused: base64 text
+        is always longer than the key it encodes.
         
         Args:
             key_file_path: Path to the key file
@@ -132,28 +265,31 @@ class KeyManager:
             if self._file_handler is None:
                 raise KeyDerivationError("File handler not available for key file operations")
 
-            if not self._file_handler.file_exists(key_file_path):
-                raise KeyDerivationError(f"Key file not found: {key_file_path}")
-
-            # Read key from file (as bytes)
-            key_data = self._file_handler.read_file(key_file_path)
-            
-            # Decode from UTF-8 to get base64 string
+            # Read key from file (as bytes). A key file only holds the
+            # key, at most base64 encoded with some surrounding whitespace,
+            # so anything much bigger is rejected without reading it in full.
+            key_size = self._settings.KEY_SIZE
+            max_size = 4 * -(-key_size // 3) + _KEY_FILE_SLACK
             try:
-                key_base64 = key_data.decode('utf-8').strip()
-            except UnicodeDecodeError as e:
-                raise KeyDerivationError(f"Key file is not valid UTF-8: {e}") from e
+                key_data = self._file_handler.read_bounded(key_file_path, max_size)
+            except FileNotFoundError as e:
+                raise KeyDerivationError(f"Key file not found: {key_file_path}") from e
+
+            # Raw key file: the contents are the key
+            if len(key_data) == key_size:
+                self._logger.debug(f"Key file loaded: {key_file_path}")
+                return key_data
             
-            # Decode from base64 to get key bytes
+            # Decode the base64 text straight from the file bytes
             try:
-                key = base64.b64decode(key_base64)
-            except Exception as e:
+                key = base64.b64decode(key_data.strip())
+            except binascii.Error as e:
                 raise KeyDerivationError(f"Key file is not valid base64: {e}") from e
 
             # Validate key size
-            if len(key) != self._settings.KEY_SIZE:
+            if len(key) != key_size:
                 raise KeyDerivationError(
-                    f"Invalid key size: expected {self._settings.KEY_SIZE} bytes, "
+                    f"Invalid key size: expected {key_size} bytes, "
                     f"got {len(key)} bytes"
                 )
 
@@ -189,17 +325,22 @@ class KeyManager:
             return password_key
 
         # Combine both keys using HKDF
-        # Use the key file as the input key material and password key as salt/context
-        combined_input = key_file + password_key
+        # Use the key file followed by the password key as the input key
+        # material. The extract step is HMAC(salt, key_file || password_key);
+        # feeding the two keys to the HMAC in turn avoids building a
+        # concatenated copy of both secrets.
+        extract = hmac.HMAC(salt, hashes.SHA256())
+        extract.update(key_file)
+        extract.update(password_key)
+        prk = extract.finalize()
 
-        hkdf = HKDF(
+        hkdf_expand = HKDFExpand(
             algorithm=hashes.SHA256(),
             length=self._settings.KEY_SIZE,
-            salt=salt,
             info=b"zesec-key-combination",
         )
 
-        combined_key = hkdf.derive(combined_input)
+        combined_key = hkdf_expand.derive(prk)
         self._logger.debug("Keys combined using HKDF")
         return combined_key
 
@@ -2,11 +2,12 @@
 
 from .cleaner import CleanerService
 from .file_handler import FileHandler
-from .path_utils import normalize_path
+from .path_utils import iter_files, normalize_path
 
 __all__ = [
     "CleanerService",
     "FileHandler",
+    "iter_files",
     "normalize_path",
 ]
 
@@ -1,15 +1,176 @@
 """Secure file cleaning service."""
 
+import ctypes
+import mmap
 import os
-import random
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, Optional
 
-from ...config.settings import Settings
-from ...interfaces.cleaner_interface import ICleaner
+from ...config.settings import get_settings
 from ...interfaces.file_handler_interface import IFileHandler
-from ...utils.exceptions import CleanerError
+from ...utils.cancellation import raise_if_cancelled
+from ...utils.exceptions import OperationCancelledError
 from ...utils.logging_config import get_logger
+from ...utils.platform import is_ssd
+from .path_utils import iter_files
+
+if TYPE_CHECKING:
+    from ...config.settings import Settings
+
+
+# fallocate(2) mode flags: keep the file size, deallocate the range
+# (discarded on SSDs), zero the range in place. Neither is guaranteed to
+# overwrite the old blocks, so they are only used as SSD discard hints.
+FALLOC_FL_KEEP_SIZE = 0x01
+FALLOC_FL_PUNCH_HOLE = 0x02
+FALLOC_FL_ZERO_RANGE = 0x10
+
+# O_DIRECT needs buffers, offsets and lengths aligned to the logical block
+# size; a page is a multiple of it on common devices
+DIRECT_IO_ALIGNMENT = mmap.PAGESIZE
+
+
+@cache
+def _load_fallocate() -> Optional[Callable]:
+    """Load fallocate(2) from libc on Linux.
+    
+    Returns:
+        The libc function, or None where it is not available
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        func = libc.fallocate64
+    except (OSError, AttributeError):
+        return None
+    func.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_int64, ctypes.c_int64]
+    func.restype = ctypes.c_int
+    return func
+
+
+def _fallocate(fd: int, mode: int, offset: int, length: int) -> bool:
+    """Call fallocate(2) on a file descriptor.
+    
+    Args:
+        fd: Open file descriptor
+        mode: FALLOC_FL_* flags
+        offset: Start of the range
+        length: Length of the range
+        
+    Returns:
+        True if the call succeeded, False if it is unsupported or failed
+        (e.g. EOPNOTSUPP on filesystems without the requested mode)
+    """
+    fallocate = _load_fallocate()
+    if fallocate is None or length <= 0:
+        return False
+    return fallocate(fd, mode, offset, length) == 0
+
+
+def _aligned_buffer(size: int) -> mmap.mmap:
+    """Allocate a zero-filled, page-aligned buffer usable for O_DIRECT writes."""
+    return mmap.mmap(-1, size)
+
+
+@lru_cache(maxsize=1)
+def _zero_block(size: int) -> memoryview:
+    """Get a shared block of zeros of the given size."""
+    return memoryview(_aligned_buffer(size))
+
+
+def _open_direct(file_path: Path) -> Optional[int]:
+    """Open a file for writes that bypass the page cache.
+    
+    Args:
+        file_path: Path to the file
+        
+    Returns:
+        An O_DIRECT file descriptor, or None where the platform or the
+        filesystem (e.g. tmpfs) does not support it
+    """
+    if not hasattr(os, "O_DIRECT"):
+        return None
+    try:
+        return os.open(file_path, os.O_WRONLY | os.O_DIRECT)
+    except OSError:
+        return None
+
+
+def _write_range(
+    fd: int,
+    direct_fd: Optional[int],
+    next_block: Callable[[int], memoryview],
+    block_size: int,
+    file_size: int,
+    cancel: Optional[threading.Event],
+) -> None:
+    """Overwrite the first file_size bytes of a file with pwrite.
+    
+    Aligned blocks go through direct_fd when it is given; anything else,
+    such as the tail of the file, goes through the page cache via fd.
+    
+    Args:
+        fd: Regular file descriptor
+        direct_fd: Optional O_DIRECT descriptor for the same file
+        next_block: Returns the next aligned buffer of the requested size
+        block_size: Largest size to request from next_block
+        file_size: Number of bytes to write
+        cancel: Optional event checked between writes
+    """
+    offset = 0
+    while offset < file_size:
+        raise_if_cancelled(cancel)
+        size = min(block_size, file_size - offset)
+        target = fd
+        if (
+            direct_fd is not None
+            and size % DIRECT_IO_ALIGNMENT == 0
+            and offset % DIRECT_IO_ALIGNMENT == 0
+        ):
+            target = direct_fd
+        offset += os.pwrite(target, next_block(size), offset)
+
+
+class _RandomStream:
+    """Cryptographically secure random bytes from a ChaCha20 keystream.
+    
+    Seeded once from os.urandom, then generated in user space into a
+    reusable buffer, instead of one getrandom call per chunk.
+    """
+
+    def __init__(self, block_size: int):
+        """Initialize the stream with a fresh random key and nonce.
+        
+        Args:
+            block_size: Largest block that will be requested
+        """
+        from cryptography.hazmat.primitives.ciphers import Cipher, algorithms
+
+        cipher = Cipher(algorithms.ChaCha20(os.urandom(32), os.urandom(16)), mode=None)
+        self._encryptor = cipher.encryptor()
+        self._zeros = _zero_block(block_size)
+        self._buffer = _aligned_buffer(block_size)
+        self._view = memoryview(self._buffer)
+
+    def read(self, size: int) -> memoryview:
+        """Get the next size random bytes.
+        
+        The returned view is only valid until the next call.
+        
+        Args:
+            size: Number of bytes, at most the block size
+            
+        Returns:
+            Random bytes
+        """
+        # Encrypting zeros yields the raw keystream
+        self._encryptor.update_into(self._zeros[:size], self._buffer)
+        return self._view[:size]
 
 
 class CleanerService:
@@ -23,7 +184,7 @@ class CleanerService:
     def __init__(
         self,
         file_handler: IFileHandler,
-        settings: Optional[Settings] = None,
+        settings: Optional["Settings"] = None,
         logger=None,
     ):
         """Initialize CleanerService.
@@ -34,16 +195,26 @@ class CleanerService:
             logger: Logger instance (defaults to module logger)
         """
         self._file_handler = file_handler
-        self._settings = settings or Settings.get_instance()
+        self._settings = settings or get_settings()
         self._logger = logger or get_logger(__name__)
 
-    def clean_file(self, file_path: Path, passes: int = 3, delete: bool = True) -> bool:
+    def clean_file(
+        self,
+        file_path: Path,
+        passes: Optional[int] = None,
+        delete: bool = True,
+        cancel: Optional[threading.Event] = None,
+    ) -> bool:
         """Securely clean a file by overwriting and optionally deleting.
         
         Args:
             file_path: Path to the file to clean
-            passes: Number of overwrite passes (default: 3)
+            passes: Number of overwrite passes (default: CLEAN_PASSES, or a
+                single pass on solid-state storage, where CLEAN_SSD_TRIM
+                discards the blocks instead)
             delete: If True, delete file after cleaning (default: True)
+            cancel: Optional event; once set, cleaning stops and the file is
+                left in place
             
         Returns:
             True if successful, False otherwise
@@ -53,14 +224,20 @@ class CleanerService:
                 self._logger.warning(f"File does not exist: {file_path}")
                 return False
 
-            self._logger.info(f"Cleaning file: {file_path} ({passes} passes, delete={delete})")
+            if passes is None and self._discard_on_ssd(file_path):
+                self._logger.info(f"Discarded file blocks: {file_path}")
+            else:
+                if passes is None:
+                    passes = self._default_passes(file_path)
 
-            # Overwrite file multiple times
-            for pass_num in range(1, passes + 1):
-                self._logger.debug(f"Overwrite pass {pass_num}/{passes}")
-                if not self.overwrite_file(file_path, passes=1):
-                    self._logger.error(f"Failed on pass {pass_num}")
-                    return False
+                self._logger.info(f"Cleaning file: {file_path} ({passes} passes, delete={delete})")
+
+                # Overwrite file multiple times
+                for pass_num in range(1, passes + 1):
+                    self._logger.debug(f"Overwrite pass {pass_num}/{passes}")
+                    if not self.overwrite_file(file_path, passes=1, cancel=cancel):
+                        self._logger.error(f"Failed on pass {pass_num}")
+                        return False
 
             # Delete file if requested
             if delete:
@@ -79,20 +256,77 @@ class CleanerService:
             self._logger.error(f"File cleaning failed: {e}")
             return False
 
+    def _default_passes(self, file_path: Path) -> int:
+        """Choose the number of overwrite passes for a file.
+        
+        SSDs remap every write to fresh flash cells, so repeated passes
+        cannot reach the old data any better than one pass does; they only
+        add writes and wear.
+        
+        Args:
+            file_path: File about to be cleaned
+            
+        Returns:
+            CLEAN_PASSES, or 1 on solid-state storage if CLEAN_SSD_SINGLE_PASS
+        """
+        passes = self._settings.CLEAN_PASSES
+        if passes > 1 and self._settings.CLEAN_SSD_SINGLE_PASS and is_ssd(file_path):
+            self._logger.info(f"Solid-state storage, using a single pass: {file_path}")
+            return 1
+        return passes
+
+    def _discard_on_ssd(self, file_path: Path) -> bool:
+        """Discard a file's blocks instead of overwriting them, if enabled.
+        
+        Punching a hole over the whole file deallocates its blocks, which
+        the filesystem passes on to the SSD as a discard (TRIM) when it is
+        mounted with discard support; where hole punching is unsupported,
+        zeroing the range is tried as the hint instead. This is one call
+        instead of writing the whole file, but whether the flash is erased
+        is up to the drive.
+        
+        Args:
+            file_path: File about to be cleaned
+            
+        Returns:
+            True if the blocks were discarded, False if the file should be
+            overwritten instead (disabled, not an SSD, or unsupported)
+        """
+        if not self._settings.CLEAN_SSD_TRIM or not is_ssd(file_path):
+            return False
+        try:
+            fd = os.open(file_path, os.O_WRONLY)
+        except OSError:
+            return False
+        try:
+            size = os.fstat(fd).st_size
+            mode = FALLOC_FL_PUNCH_HOLE | FALLOC_FL_KEEP_SIZE
+            if not _fallocate(fd, mode, 0, size) and not _fallocate(
+                fd, FALLOC_FL_ZERO_RANGE | FALLOC_FL_KEEP_SIZE, 0, size
+            ):
+                return False
+            os.fsync(fd)
+            return True
+        finally:
+            os.close(fd)
+
     def clean_directory(
         self,
         dir_path: Path,
-        passes: int = 3,
+        passes: Optional[int] = None,
         recursive: bool = True,
         delete: bool = True,
+        cancel: Optional[threading.Event] = None,
     ) -> bool:
         """Securely clean all files in a directory.
         
         Args:
             dir_path: Path to the directory
-            passes: Number of overwrite passes per file
+            passes: Number of overwrite passes per file (default as for
+                clean_file)
             recursive: If True, process subdirectories
             delete: If True, delete files after cleaning (default: True)
+            cancel: Optional event; once set, remaining files are skipped
             
         Returns:
             True if all files cleaned successfully, False otherwise
@@ -102,23 +336,28 @@ class CleanerService:
             return False
 
         # Find all files
-        pattern = "**/*" if recursive else "*"
-        files = [f for f in dir_path.glob(pattern) if f.is_file()]
+        files = list(iter_files(dir_path, recursive))
 
         self._logger.info(f"Cleaning {len(files)} files in {dir_path} (delete={delete})")
 
-        all_success = True
-        for file_path in files:
-            if not self.clean_file(file_path, passes, delete=delete):
-                all_success = False
+        def clean_one(file_path: Path) -> bool:
+            return self.clean_file(file_path, passes, delete=delete, cancel=cancel)
+
+        # Cleaning is dominated by writes and fsync, which release the GIL,
+        # so several files in flight keep the device queue busy
+        max_workers = min(len(files), self._settings.CLEAN_WORKERS)
+        if max_workers <= 1:
+            return all([clean_one(file_path) for file_path in files])
 
-        return all_success
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return all(list(pool.map(clean_one, files)))
 
     def overwrite_file(
         self,
         file_path: Path,
         data: Optional[bytes] = None,
         passes: int = 1,
+        cancel: Optional[threading.Event] = None,
     ) -> bool:
         """Overwrite file content without deleting.
         
@@ -126,64 +365,69 @@ class CleanerService:
             file_path: Path to the file
             data: Data to write. If None, writes zeros
             passes: Number of overwrite passes
+            cancel: Optional event checked between buffer writes
             
         Returns:
             True if successful, False otherwise
         """
         try:
+            raise_if_cancelled(cancel)
+
             if not self._file_handler.file_exists(file_path):
                 return False
 
             file_size = self._file_handler.get_file_size(file_path)
 
-            for pass_num in range(passes):
-                # Open file in read-write mode
-                with open(file_path, "r+b") as f:
-                    # Seek to beginning to ensure we overwrite from the start
-                    f.seek(0)
-                    
-                    # Write zeros or provided data
-                    if data is None:
-                        # Write zeros
-                        buffer_size = self._settings.BUFFER_SIZE
-                        remaining = file_size
-                        while remaining > 0:
-                            write_size = min(buffer_size, remaining)
-                            f.write(b"\x00" * write_size)
-                            remaining -= write_size
-                    else:
-                        # Write provided data (repeat if needed)
-                        remaining = file_size
-                        data_len = len(data)
-                        while remaining > 0:
-                            write_size = min(data_len, remaining)
-                            f.write(data[:write_size])
-                            remaining -= write_size
+            buffer_size = self._settings.BUFFER_SIZE
+            if data is None:
+                block = _zero_block(buffer_size)
+            else:
+                # Repeat the provided data up to about one buffer, so it is
+                # written in buffer-sized calls however short it is
+                tiled = data * max(1, buffer_size // len(data))
+                block = memoryview(_aligned_buffer(len(tiled)))
+                block[:] = tiled
+            block_size = len(block)
+
+            # Open file once for all passes. Each pass is still fsynced, so
+            # it reaches the disk rather than being overwritten by the next
+            # pass in the page cache. Where supported, aligned blocks are
+            # written with O_DIRECT, skipping the copy into the page cache.
+            fd = os.open(file_path, os.O_WRONLY | getattr(os, "O_BINARY", 0))
+            direct_fd = _open_direct(file_path)
+            try:
+                for pass_num in range(passes):
+                    # Write zeros or provided data. Zeros are really written:
+                    # FALLOC_FL_ZERO_RANGE may only mark extents unwritten or
+                    # reallocate them, leaving the old data on disk.
+                    _write_range(
+                        fd, direct_fd, lambda size: block[:size], block_size, file_size, cancel
+                    )
 
                     # Truncate file to original size (in case file grew)
-                    f.truncate(file_size)
-                    
-                    # Flush to disk
-                    f.flush()
-                    os.fsync(f.fileno())  # Force write to disk
-
-                # On last pass, optionally write random data
-                if pass_num == passes - 1 and data is None:
-                    with open(file_path, "r+b") as f:
-                        f.seek(0)  # Seek to beginning
-                        remaining = file_size
-                        buffer_size = self._settings.BUFFER_SIZE
-                        while remaining > 0:
-                            write_size = min(buffer_size, remaining)
-                            random_data = os.urandom(write_size)
-                            f.write(random_data)
-                            remaining -= write_size
-                        f.truncate(file_size)  # Ensure file size is correct
-                        f.flush()
-                        os.fsync(f.fileno())
+                    os.ftruncate(fd, file_size)
+
+                    # Force write to disk
+                    os.fsync(fd)
+
+                    # On last pass, optionally write random data
+                    if pass_num == passes - 1 and data is None:
+                        random_stream = _RandomStream(buffer_size)
+                        _write_range(
+                            fd, direct_fd, random_stream.read, buffer_size, file_size, cancel
+                        )
+                        os.ftruncate(fd, file_size)  # Ensure file size is correct
+                        os.fsync(fd)
+            finally:
+                if direct_fd is not None:
+                    os.close(direct_fd)
+                os.close(fd)
 
             return True
 
+        except OperationCancelledError:
+            self._logger.warning(f"Overwrite cancelled: {file_path}")
+            return False
         except Exception as e:
             self._logger.error(f"Failed to overwrite file {file_path}: {e}")
             return False
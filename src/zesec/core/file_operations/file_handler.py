@@ -1,13 +1,59 @@
 """File I/O operations handler."""
 
+import mmap
+import os
+import stat
+import tempfile
+import threading
+from contextlib import contextmanager
+from functools import cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, BinaryIO, Iterable, Iterator, Optional
 
-from ...config.settings import Settings
-from ...interfaces.file_handler_interface import IFileHandler
+from ...config.settings import get_settings
 from ...utils.exceptions import FileOperationError
 from ...utils.logging_config import get_logger
 
+if TYPE_CHECKING:
+    from ...config.settings import Settings
+
+# Sequential read-ahead hints are only available on POSIX systems
+_HAS_FADVISE = hasattr(os, "posix_fadvise")
+
+# Flags for creating a new file that must not exist yet
+_EXCLUSIVE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+
+# Files at least this large are memory-mapped by map_file() instead of read
+_MMAP_THRESHOLD = 4 * 1024 * 1024
+
+_umask_lock = threading.Lock()
+
+
+@cache
+def _new_file_mode() -> int:
+    """Get the permission bits open() gives a new file under the umask."""
+    # The umask can only be read by setting it. The placeholder is strict,
+    # so files created by other threads meanwhile are never too permissive.
+    with _umask_lock:
+        umask = os.umask(0o077)
+        os.umask(umask)
+    return 0o666 & ~umask
+
+
+def _replacement_mode(file_path: Path) -> int:
+    """Get the permission bits a file replacing file_path should have.
+    
+    Args:
+        file_path: File that is about to be replaced or created
+        
+    Returns:
+        The existing file's mode, or the default for a new file
+    """
+    try:
+        return stat.S_IMODE(os.stat(file_path).st_mode)
+    except OSError:
+        return _new_file_mode()
+
 
 class FileHandler:
     """Cross-platform file I/O operations handler.
@@ -18,7 +64,7 @@ class FileHandler:
 
     def __init__(
         self,
-        settings: Optional[Settings] = None,
+        settings: Optional["Settings"] = None,
         logger=None,
     ):
         """Initialize FileHandler.
@@ -27,7 +73,7 @@ class FileHandler:
             settings: Application settings (defaults to singleton)
             logger: Logger instance (defaults to module logger)
         """
-        self._settings = settings or Settings.get_instance()
+        self._settings = settings or get_settings()
         self._logger = logger or get_logger(__name__)
 
     def read_file(self, file_path: Path) -> bytes:
@@ -45,7 +91,11 @@ class FileHandler:
         """
         try:
             self._logger.debug(f"Reading file: {file_path}")
-            with open(file_path, "rb") as f:
+            # Unbuffered: readall() sizes one buffer from fstat and reads
+            # straight into it, without going through a BufferedReader
+            with open(file_path, "rb", buffering=0) as f:
+                if _HAS_FADVISE:
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
                 return f.read()
         except FileNotFoundError:
             self._logger.error(f"File not found: {file_path}")
@@ -54,6 +104,88 @@ class FileHandler:
             self._logger.error(f"Failed to read file {file_path}: {e}")
             raise FileOperationError(f"Failed to read file: {e}") from e
 
+    def read_bounded(self, file_path: Path, max_bytes: int) -> bytes:
+        """Read a file that must not be larger than max_bytes.
+        
+        At most max_bytes + 1 bytes are read, so an oversized file is
+        rejected without loading it.
+        
+        Args:
+            file_path: Path to the file
+            max_bytes: Maximum accepted file size
+            
+        Returns:
+            File contents as bytes
+            
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            FileOperationError: If file cannot be read or is larger than max_bytes
+        """
+        try:
+            self._logger.debug(f"Reading file: {file_path} (max {max_bytes} bytes)")
+            with open(file_path, "rb", buffering=0) as f:
+                data = f.read(max_bytes + 1)
+        except FileNotFoundError:
+            self._logger.error(f"File not found: {file_path}")
+            raise
+        except Exception as e:
+            self._logger.error(f"Failed to read file {file_path}: {e}")
+            raise FileOperationError(f"Failed to read file: {e}") from e
+
+        if len(data) > max_bytes:
+            self._logger.error(f"File too large: {file_path} (over {max_bytes} bytes)")
+            raise FileOperationError(f"File is larger than {max_bytes} bytes: {file_path}")
+        return data
+
+    @contextmanager
+    def map_file(self, file_path: Path) -> Iterator[bytes | memoryview]:
+        """Open file contents for reading without copying where possible.
+        
+        Large files are memory-mapped, so consumers read straight from the
+        page cache; small files are read into memory as usual.
+        
+        Args:
+            file_path: Path to the file
+            
+        Yields:
+            File contents as bytes or a read-only memoryview. The contents
+            must not be used after the context exits.
+            
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            FileOperationError: If file cannot be read
+        """
+        try:
+            self._logger.debug(f"Mapping file: {file_path}")
+            with open(file_path, "rb", buffering=0) as f:
+                if os.fstat(f.fileno()).st_size < _MMAP_THRESHOLD:
+                    mapped = None
+                    data = f.read()
+                else:
+                    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    data = memoryview(mapped)
+        except FileNotFoundError:
+            self._logger.error(f"File not found: {file_path}")
+            raise
+        except Exception as e:
+            self._logger.error(f"Failed to read file {file_path}: {e}")
+            raise FileOperationError(f"Failed to read file: {e}") from e
+
+        if mapped is None:
+            yield data
+            return
+        try:
+            yield data
+        finally:
+            # Unmap before returning so the file can be cleaned or deleted.
+            # If the caller still holds views into the mapping (e.g. while an
+            # exception propagates), it is unmapped once they are collected.
+            data.release()
+            try:
+                mapped.close()
+            except BufferError:
+                self._logger.debug(f"Mapping still in use, deferring unmap: {file_path}")
+
     def write_file(self, file_path: Path, data: bytes) -> bool:
         """Write bytes to a file.
         
@@ -67,11 +199,8 @@ class FileHandler:
         try:
             self._logger.debug(f"Writing file: {file_path} ({len(data)} bytes)")
 
-            # Ensure directory exists
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Write file
-            with open(file_path, "wb") as f:
+            f, _ = self._open_for_write(file_path, atomic=False, exclusive=False)
+            with f:
                 f.write(data)
 
             self._logger.debug(f"File written successfully: {file_path}")
@@ -81,6 +210,103 @@ class FileHandler:
             self._logger.error(f"Failed to write file {file_path}: {e}")
             return False
 
+    def write_stream(
+        self,
+        file_path: Path,
+        chunks: Iterable[bytes],
+        atomic: bool = False,
+        exclusive: bool = False,
+    ) -> None:
+        """Write a sequence of chunks to a file.
+        
+        Args:
+            file_path: Path to the file
+            chunks: Data chunks to write, in order
+            atomic: If True, write to a temporary file in the same directory
+                and only move it into place once every chunk was written, so
+                a failure never leaves partial data at file_path. The result
+                keeps the replaced file's permissions, or gets the umask
+                default for a new file.
+            exclusive: If True, only create a new file (owner-only, like the
+                atomic temporary file) and never replace an existing one; a
+                failed write removes the new file again. Takes precedence
+                over atomic.
+            
+        Raises:
+            FileExistsError: If exclusive is set and file_path already exists
+            FileOperationError: If the file cannot be written. Exceptions
+                raised while producing chunks propagate unchanged.
+        """
+        self._logger.debug(f"Writing file stream: {file_path}")
+        atomic = atomic and not exclusive
+        try:
+            f, target = self._open_for_write(file_path, atomic, exclusive)
+        except FileExistsError:
+            raise
+        except OSError as e:
+            self._logger.error(f"Failed to write file {file_path}: {e}")
+            raise FileOperationError(f"Failed to write file: {e}") from e
+
+        try:
+            with f:
+                for chunk in chunks:
+                    f.write(chunk)
+            if atomic:
+                os.replace(target, file_path)
+        except BaseException as e:
+            if atomic or exclusive:
+                target.unlink(missing_ok=True)
+            if isinstance(e, OSError):
+                self._logger.error(f"Failed to write file {file_path}: {e}")
+                raise FileOperationError(f"Failed to write file: {e}") from e
+            raise
+
+        self._logger.debug(f"File written successfully: {file_path}")
+
+    def _open_for_write(
+        self, file_path: Path, atomic: bool, exclusive: bool
+    ) -> tuple[BinaryIO, Path]:
+        """Open a file for writing, creating its directory only if missing.
+        
+        Args:
+            file_path: Path to the file
+            atomic: If True, open a temporary file next to file_path instead
+            exclusive: If True, create file_path owner-only, failing if it exists
+            
+        Returns:
+            Tuple of (open binary file, path actually being written)
+            
+        Raises:
+            OSError: If the file cannot be opened
+        """
+        def _open() -> tuple[BinaryIO, Path]:
+            if exclusive:
+                fd = os.open(file_path, _EXCLUSIVE_FLAGS, 0o600)
+                return os.fdopen(fd, "wb"), file_path
+            if not atomic:
+                return open(file_path, "wb"), file_path
+            fd, temp_name = tempfile.mkstemp(
+                dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp"
+            )
+            # mkstemp creates the file owner-only; give it the permissions a
+            # plain write would have, so they do not depend on the write path
+            if hasattr(os, "fchmod"):
+                try:
+                    os.fchmod(fd, _replacement_mode(file_path))
+                except OSError:
+                    os.close(fd)
+                    os.unlink(temp_name)
+                    raise
+            return os.fdopen(fd, "wb"), Path(temp_name)
+
+        try:
+            return _open()
+        except FileNotFoundError:
+            # The directory usually exists already, so it is only created
+            # (and the open retried) when the first attempt says it is missing
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            return _open()
+
     def file_exists(self, file_path: Path) -> bool:
         """Check if file exists.
         
@@ -90,7 +316,10 @@ class FileHandler:
         Returns:
             True if file exists, False otherwise
         """
-        return file_path.exists() and file_path.is_file()
+        try:
+            return stat.S_ISREG(os.stat(file_path).st_mode)
+        except (FileNotFoundError, NotADirectoryError):
+            return False
 
     def get_file_size(self, file_path: Path) -> int:
         """Get file size in bytes.
@@ -104,10 +333,14 @@ class FileHandler:
         Raises:
             FileNotFoundError: If file doesn't exist
         """
-        if not self.file_exists(file_path):
+        try:
+            st = os.stat(file_path)
+        except (FileNotFoundError, NotADirectoryError):
+            st = None
+        if st is None or not stat.S_ISREG(st.st_mode):
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        return file_path.stat().st_size
+        return st.st_size
 
     def ensure_directory(self, dir_path: Path) -> bool:
         """Ensure directory exists, create if needed.
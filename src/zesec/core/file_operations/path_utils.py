@@ -1,7 +1,8 @@
 """Path utility functions for cross-platform compatibility."""
 
+import os
 from pathlib import Path
-from typing import Union
+from typing import Iterator, Union
 
 from ...utils.platform import normalize_path as _normalize_path
 
@@ -17,3 +18,27 @@ def normalize_path(path: Union[str, Path]) -> Path:
     """
     return _normalize_path(path)
 
+
+def iter_files(root: Path, recursive: bool = True) -> Iterator[Path]:
+    """Iterate over the files in a directory.
+    
+    Uses os.scandir, whose entries carry the file type from the directory
+    listing itself, so no per-entry stat is needed on most platforms.
+    Symlinked directories are not descended into.
+    
+    Args:
+        root: Directory to scan
+        recursive: If True, include files in subdirectories
+        
+    Yields:
+        Path of each regular file (or symlink to one)
+    """
+    pending = [os.fspath(root)]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        pending.append(entry.path)
+                elif entry.is_file():
+                    yield Path(entry.path)
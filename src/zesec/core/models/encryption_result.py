@@ -4,8 +4,11 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
+# Display labels for each operation, so __str__ doesn't rebuild them per call
+_OP_LABELS = {"encrypt": "Encrypt", "decrypt": "Decrypt"}
 
-@dataclass
+
+@dataclass(slots=True)
 class EncryptionResult:
     """Result of an encryption or decryption operation."""
 
@@ -17,8 +20,9 @@ class EncryptionResult:
 
     def __str__(self) -> str:
         """String representation of the result."""
+        label = _OP_LABELS.get(self.operation) or self.operation.capitalize()
         if self.success:
-            return f"{self.operation.capitalize()} successful: {self.output_path}"
+            return f"{label} successful: {self.output_path}"
         else:
-            return f"{self.operation.capitalize()} failed: {self.error}"
+            return f"{label} failed: {self.error}"
 
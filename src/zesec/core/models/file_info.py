@@ -1,11 +1,12 @@
 """File information model."""
 
+import os
+import stat
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class FileInfo:
     """Information about a file."""
 
@@ -25,16 +26,19 @@ class FileInfo:
         Returns:
             FileInfo instance
         """
-        exists = path.exists()
-        is_file = path.is_file() if exists else False
-        is_directory = path.is_dir() if exists else False
-        size = path.stat().st_size if exists and is_file else 0
+        # One stat call answers every question below
+        try:
+            st = os.stat(path)
+        except (FileNotFoundError, NotADirectoryError):
+            return cls(path=path, size=0, exists=False, is_directory=False, is_file=False)
+
+        is_file = stat.S_ISREG(st.st_mode)
 
         return cls(
             path=path,
-            size=size,
-            exists=exists,
-            is_directory=is_directory,
+            size=st.st_size if is_file else 0,
+            exists=True,
+            is_directory=stat.S_ISDIR(st.st_mode),
             is_file=is_file,
         )
 
@@ -2,7 +2,7 @@
 
 from dependency_injector import containers, providers
 
-from ..config.settings import Settings
+from ..config.settings import get_settings
 from ..core.encryption import EncryptorService, KeyManager
 from ..core.file_operations import CleanerService, FileHandler
 
@@ -14,7 +14,7 @@ class ApplicationContainer(containers.DeclarativeContainer):
     config = providers.Configuration()
 
     # Settings (singleton)
-    settings = providers.Singleton(Settings.get_instance)
+    settings = providers.Singleton(get_settings)
 
     # Core services (singletons)
     file_handler = providers.Singleton(FileHandler)
@@ -3,7 +3,7 @@
 from pathlib import Path
 from typing import Optional
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, QThreadPool, Signal
 
 from ...di.container import ApplicationContainer
 from ...interfaces.cleaner_interface import ICleaner
@@ -28,6 +28,9 @@ class CleanController(QObject):
         self._container = container
         self._cleaner: ICleaner = container.cleaner()
         self._current_worker: Optional[CleanWorker] = None
+        # Cancelled workers that may still be queued or running; kept
+        # referenced so they are not destroyed before they finish
+        self._pending_workers: list[CleanWorker] = []
         
     def clean_file(
         self,
@@ -46,9 +49,7 @@ class CleanController(QObject):
             return
             
         # Cancel any existing operation
-        if self._current_worker and self._current_worker.isRunning():
-            self._current_worker.terminate()
-            self._current_worker.wait()
+        self.cancel_operation()
         
         # Create worker for async operation
         worker = CleanWorker(
@@ -58,17 +59,31 @@ class CleanController(QObject):
         )
         
         # Connect worker signals
-        worker.progress.connect(self.progress_updated)
-        worker.finished.connect(self.operation_completed)
-        worker.error.connect(self.error_occurred)
+        worker.signals.progress.connect(self.progress_updated)
+        worker.signals.finished.connect(self.operation_completed)
+        worker.signals.error.connect(self.error_occurred)
         
-        # Store reference and start worker
+        # Store reference and queue worker on the shared thread pool
         self._current_worker = worker
-        worker.start()
+        QThreadPool.globalInstance().start(worker)
         
     def cancel_operation(self):
-        """Cancel current cleaning operation."""
-        if self._current_worker and self._current_worker.isRunning():
-            self._current_worker.terminate()
-            self._current_worker.wait()
+        """Cancel current cleaning operation.
+        
+        The worker is asked to stop and left to wind down on the thread
+        pool, so the GUI thread never blocks waiting for it.
+        """
+        self._pending_workers = [w for w in self._pending_workers if not w.is_done()]
+
+        worker = self._current_worker
+        self._current_worker = None
+        if worker is None or worker.is_done():
+            return
+
+        # Detach it so a late result doesn't reach the view
+        worker.signals.progress.disconnect(self.progress_updated)
+        worker.signals.finished.disconnect(self.operation_completed)
+        worker.signals.error.disconnect(self.error_occurred)
+        worker.request_cancel()
+        self._pending_workers.append(worker)
 
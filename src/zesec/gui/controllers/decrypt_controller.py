@@ -3,11 +3,12 @@
 from pathlib import Path
 from typing import Optional
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, QThreadPool, Signal
 
 from ...di.container import ApplicationContainer
 from ...interfaces.encryptor_interface import IEncryptor
 from ...core.models.encryption_result import EncryptionResult
+from ...utils.secure_memory import wipe_buffer
 from ..workers.decrypt_worker import DecryptWorker
 
 
@@ -29,22 +30,28 @@ class DecryptController(QObject):
         self._container = container
         self._encryptor: IEncryptor = container.encryptor()
         self._current_worker: Optional[DecryptWorker] = None
+        # Cancelled workers that may still be queued or running; kept
+        # referenced so they are not destroyed before they finish
+        self._pending_workers: list[DecryptWorker] = []
         
     def decrypt_file(
         self,
         file_path: Path,
-        password: str,
+        password: str | bytearray,
         key_file_path: Optional[Path] = None
     ):
         """Initiate decryption operation.
         
         Args:
             file_path: Path to encrypted file
-            password: Decryption password
+            password: Decryption password. A bytearray is wiped once the
+                operation is over.
             key_file_path: Optional key file path
         """
         # Validation
         if not file_path.exists():
+            if isinstance(password, bytearray):
+                wipe_buffer(password)
             self.error_occurred.emit("File does not exist")
             return
             
@@ -53,9 +60,7 @@ class DecryptController(QObject):
             return
             
         # Cancel any existing operation
-        if self._current_worker and self._current_worker.isRunning():
-            self._current_worker.terminate()
-            self._current_worker.wait()
+        self.cancel_operation()
         
         # Create worker for async operation
         worker = DecryptWorker(
@@ -66,17 +71,31 @@ class DecryptController(QObject):
         )
         
         # Connect worker signals
-        worker.progress.connect(self.progress_updated)
-        worker.finished.connect(self.operation_completed)
-        worker.error.connect(self.error_occurred)
+        worker.signals.progress.connect(self.progress_updated)
+        worker.signals.finished.connect(self.operation_completed)
+        worker.signals.error.connect(self.error_occurred)
         
-        # Store reference and start worker
+        # Store reference and queue worker on the shared thread pool
         self._current_worker = worker
-        worker.start()
+        QThreadPool.globalInstance().start(worker)
         
     def cancel_operation(self):
-        """Cancel current decryption operation."""
-        if self._current_worker and self._current_worker.isRunning():
-            self._current_worker.terminate()
-            self._current_worker.wait()
+        """Cancel current decryption operation.
+        
+        The worker is asked to stop and left to wind down on the thread
+        pool, so the GUI thread never blocks waiting for it.
+        """
+        self._pending_workers = [w for w in self._pending_workers if not w.is_done()]
+
+        worker = self._current_worker
+        self._current_worker = None
+        if worker is None or worker.is_done():
+            return
+
+        # Detach it so a late result doesn't reach the view
+        worker.signals.progress.disconnect(self.progress_updated)
+        worker.signals.finished.disconnect(self.operation_completed)
+        worker.signals.error.disconnect(self.error_occurred)
+        worker.request_cancel()
+        self._pending_workers.append(worker)
 
@@ -3,11 +3,12 @@
 from pathlib import Path
 from typing import Optional
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, QThreadPool, Signal
 
 from ...di.container import ApplicationContainer
 from ...interfaces.encryptor_interface import IEncryptor
 from ...core.models.encryption_result import EncryptionResult
+from ...utils.secure_memory import wipe_buffer
 from ..workers.encrypt_worker import EncryptWorker
 
 
@@ -29,11 +30,14 @@ class EncryptController(QObject):
         self._container = container
         self._encryptor: IEncryptor = container.encryptor()
         self._current_worker: Optional[EncryptWorker] = None
+        # Cancelled workers that may still be queued or running; kept
+        # referenced so they are not destroyed before they finish
+        self._pending_workers: list[EncryptWorker] = []
         
     def encrypt_file(
         self,
         file_path: Path,
-        password: str,
+        password: str | bytearray,
         key_file_path: Optional[Path] = None,
         clean_original: bool = True
     ):
@@ -41,12 +45,15 @@ class EncryptController(QObject):
         
         Args:
             file_path: Path to file to encrypt
-            password: Encryption password
+            password: Encryption password. A bytearray is wiped once the
+                operation is over.
             key_file_path: Optional key file path
             clean_original: Whether to clean original file
         """
         # Validation
         if not file_path.exists():
+            if isinstance(password, bytearray):
+                wipe_buffer(password)
             self.error_occurred.emit("File does not exist")
             return
             
@@ -55,9 +62,7 @@ class EncryptController(QObject):
             return
             
         # Cancel any existing operation
-        if self._current_worker and self._current_worker.isRunning():
-            self._current_worker.terminate()
-            self._current_worker.wait()
+        self.cancel_operation()
         
         # Create worker for async operation
         worker = EncryptWorker(
@@ -69,17 +74,31 @@ class EncryptController(QObject):
         )
         
         # Connect worker signals
-        worker.progress.connect(self.progress_updated)
-        worker.finished.connect(self.operation_completed)
-        worker.error.connect(self.error_occurred)
+        worker.signals.progress.connect(self.progress_updated)
+        worker.signals.finished.connect(self.operation_completed)
+        worker.signals.error.connect(self.error_occurred)
         
-        # Store reference and start worker
+        # Store reference and queue worker on the shared thread pool
         self._current_worker = worker
-        worker.start()
+        QThreadPool.globalInstance().start(worker)
         
     def cancel_operation(self):
-        """Cancel current encryption operation."""
-        if self._current_worker and self._current_worker.isRunning():
-            self._current_worker.terminate()
-            self._current_worker.wait()
+        """Cancel current encryption operation.
+        
+        The worker is asked to stop and left to wind down on the thread
+        pool, so the GUI thread never blocks waiting for it.
+        """
+        self._pending_workers = [w for w in self._pending_workers if not w.is_done()]
+
+        worker = self._current_worker
+        self._current_worker = None
+        if worker is None or worker.is_done():
+            return
+
+        # Detach it so a late result doesn't reach the view
+        worker.signals.progress.disconnect(self.progress_updated)
+        worker.signals.finished.disconnect(self.operation_completed)
+        worker.signals.error.disconnect(self.error_occurred)
+        worker.request_cancel()
+        self._pending_workers.append(worker)
 
@@ -2,12 +2,11 @@
 
 from pathlib import Path
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, QThreadPool, Signal
 
 from ...di.container import ApplicationContainer
 from typing import Optional
 
-from ...core.encryption import KeyManager
 from ..workers.key_generation_worker import KeyGenerationWorker
 
 
@@ -29,41 +28,56 @@ class KeyController(QObject):
         self._container = container
         self._key_manager = container.key_manager()
         self._current_worker: Optional[KeyGenerationWorker] = None
+        # Cancelled workers that may still be queued or running; kept
+        # referenced so they are not destroyed before they finish
+        self._pending_workers: list[KeyGenerationWorker] = []
         
-    def generate_key_file(self, key_file_path: Path):
+    def generate_key_file(self, key_file_path: Path, overwrite: bool = False):
         """Initiate key generation operation.
         
+        Whether the file already exists is checked by the worker, as part of
+        creating it, rather than with a stat on the GUI thread.
+        
         Args:
             key_file_path: Path where key file should be saved
+            overwrite: Whether an existing file may be replaced
         """
-        # Validation
-        if key_file_path.exists():
-            self.error_occurred.emit("File already exists. Please choose a different path.")
-            return
-            
         # Cancel any existing operation
-        if self._current_worker and self._current_worker.isRunning():
-            self._current_worker.terminate()
-            self._current_worker.wait()
+        self.cancel_operation()
         
         # Create worker for async operation
         worker = KeyGenerationWorker(
             self._key_manager,
-            key_file_path
+            key_file_path,
+            overwrite
         )
         
         # Connect worker signals
-        worker.progress.connect(self.progress_updated)
-        worker.finished.connect(self.operation_completed)
-        worker.error.connect(self.error_occurred)
+        worker.signals.progress.connect(self.progress_updated)
+        worker.signals.finished.connect(self.operation_completed)
+        worker.signals.error.connect(self.error_occurred)
         
-        # Store reference and start worker
+        # Store reference and queue worker on the shared thread pool
         self._current_worker = worker
-        worker.start()
+        QThreadPool.globalInstance().start(worker)
         
     def cancel_operation(self):
-        """Cancel current key generation operation."""
-        if self._current_worker and self._current_worker.isRunning():
-            self._current_worker.terminate()
-            self._current_worker.wait()
+        """Cancel current key generation operation.
+        
+        The worker is asked to stop and left to wind down on the thread
+        pool, so the GUI thread never blocks waiting for it.
+        """
+        self._pending_workers = [w for w in self._pending_workers if not w.is_done()]
+
+        worker = self._current_worker
+        self._current_worker = None
+        if worker is None or worker.is_done():
+            return
+
+        # Detach it so a late result doesn't reach the view
+        worker.signals.progress.disconnect(self.progress_updated)
+        worker.signals.finished.disconnect(self.operation_completed)
+        worker.signals.error.disconnect(self.error_occurred)
+        worker.request_cancel()
+        self._pending_workers.append(worker)
 
@@ -1,12 +1,11 @@
 """GUI application entry point."""
 
 import sys
-from pathlib import Path
 
 from PySide6.QtWidgets import QApplication
 from PySide6.QtCore import Qt
 
-from ..config.settings import Settings
+from ..config.settings import get_settings
 from ..utils.logging_config import get_logger, setup_logging
 from ..di.container import ApplicationContainer
 from .windows.main_window import MainWindow
@@ -23,7 +22,7 @@ def main() -> int:
     logger = get_logger(__name__)
     
     # Load settings
-    settings = Settings.get_instance()
+    settings = get_settings()
     
     # Create QApplication
     app = QApplication(sys.argv)
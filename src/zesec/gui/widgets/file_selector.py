@@ -3,6 +3,7 @@
 from pathlib import Path
 from typing import Optional
 
+from PySide6.QtCore import QDir
 from PySide6.QtWidgets import (
     QWidget, QHBoxLayout, QLineEdit, QPushButton, QFileDialog
 )
@@ -22,6 +23,13 @@ class FileSelectorWidget(QWidget):
         super().__init__(parent)
         self._is_directory = is_directory
         self._file_filter = file_filter
+        # The line edit is read-only, so the selected path is only ever set
+        # through set_path() and can be kept as-is instead of re-parsed.
+        # Text from the file dialog is parsed into a Path on first use.
+        self._path: Optional[Path] = None
+        self._path_text = ""
+        # Created on first browse and reused after that
+        self._dialog: Optional[QFileDialog] = None
         self._init_ui()
         
     def _init_ui(self):
@@ -40,28 +48,53 @@ class FileSelectorWidget(QWidget):
         
     def _browse_file(self):
         """Open file dialog."""
+        dialog = self._dialog
+        if dialog is None:
+            dialog = self._dialog = self._create_dialog()
+        
+        if dialog.exec():
+            self.set_path(dialog.selectedFiles()[0])
+            
+    def _create_dialog(self) -> QFileDialog:
+        """Create the file dialog used by this selector.
+        
+        One dialog is kept per selector, so the platform dialog backend is
+        only set up once and the dialog reopens in the last visited folder.
+        """
         if self._is_directory:
-            path = QFileDialog.getExistingDirectory(self, "Select Directory")
+            dialog = QFileDialog(self, "Select Directory")
+            dialog.setFileMode(QFileDialog.FileMode.Directory)
+            dialog.setOption(QFileDialog.Option.ShowDirsOnly, True)
         else:
-            path, _ = QFileDialog.getOpenFileName(
-                self, "Select File", "", self._file_filter
-            )
-        
-        if path:
-            self.set_path(Path(path))
+            dialog = QFileDialog(self, "Select File")
+            dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+            dialog.setNameFilter(self._file_filter)
+        return dialog
             
-    def set_path(self, path: Path):
-        """Set the selected path."""
-        self._path_edit.setText(str(path))
+    def set_path(self, path: Path | str):
+        """Set the selected path.
+        
+        Args:
+            path: Selected path. A string, as returned by a file dialog, is
+                shown directly and only parsed once get_path() needs it.
+        """
+        if isinstance(path, str):
+            self._path = None
+            self._path_text = QDir.toNativeSeparators(path)
+        else:
+            self._path = path
+            self._path_text = str(path)
+        self._path_edit.setText(self._path_text)
         
     def get_path(self) -> Optional[Path]:
         """Get the selected path."""
-        text = self._path_edit.text()
-        if text:
-            return Path(text)
-        return None
+        if self._path is None and self._path_text:
+            self._path = Path(self._path_text)
+        return self._path
         
     def clear(self):
         """Clear the selected path."""
+        self._path = None
+        self._path_text = ""
         self._path_edit.clear()
 
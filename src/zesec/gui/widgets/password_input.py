@@ -1,9 +1,21 @@
 """Secure password input widget."""
 
+from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QLineEdit, QLabel, QCheckBox
 )
 
+from ...utils.secure_memory import to_secret_buffer
+
+# Keep input methods from predicting, learning or caching the password,
+# including while "Show password" is checked
+_PASSWORD_INPUT_HINTS = (
+    Qt.InputMethodHint.ImhSensitiveData
+    | Qt.InputMethodHint.ImhHiddenText
+    | Qt.InputMethodHint.ImhNoPredictiveText
+    | Qt.InputMethodHint.ImhNoAutoUppercase
+)
+
 
 class PasswordInputWidget(QWidget):
     """Widget for secure password input with show/hide toggle."""
@@ -28,6 +40,7 @@ class PasswordInputWidget(QWidget):
         
         self._password_edit = QLineEdit()
         self._password_edit.setEchoMode(QLineEdit.EchoMode.Password)
+        self._password_edit.setInputMethodHints(_PASSWORD_INPUT_HINTS)
         layout.addWidget(self._password_edit)
         
         self._show_password_check = QCheckBox("Show password")
@@ -40,11 +53,21 @@ class PasswordInputWidget(QWidget):
             self._password_edit.setEchoMode(QLineEdit.EchoMode.Normal)
         else:
             self._password_edit.setEchoMode(QLineEdit.EchoMode.Password)
+        # Changing the echo mode resets the hints
+        self._password_edit.setInputMethodHints(_PASSWORD_INPUT_HINTS)
             
     def get_password(self) -> str:
         """Get the entered password."""
         return self._password_edit.text()
         
+    def get_password_bytes(self) -> bytearray:
+        """Get the entered password as a wipeable UTF-8 buffer.
+        
+        Returns:
+            Encoded password; wipe it with wipe_buffer() once used
+        """
+        return to_secret_buffer(self._password_edit.text())
+        
     def set_password(self, password: str):
         """Set the password (for testing purposes)."""
         self._password_edit.setText(password)
@@ -1,15 +1,14 @@
 """Main window for Zesec GUI application."""
 
-from pathlib import Path
+from functools import partial
 from typing import Optional
 
+from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
+    QMainWindow, QWidget, QVBoxLayout,
     QPushButton, QLabel, QFileDialog, QMessageBox,
     QTabWidget, QCheckBox, QProgressBar, QGroupBox,
-    QFormLayout
 )
-from PySide6.QtCore import Qt
 
 from ...di.container import ApplicationContainer
 from ...core.models.encryption_result import EncryptionResult
@@ -24,6 +23,16 @@ from ..widgets.password_input import PasswordInputWidget
 class MainWindow(QMainWindow):
     """Main application window."""
     
+    # Applied once to the whole window; widgets opt in by object name
+    _STYLE_SHEET = """
+        QPushButton#primaryButton { font-weight: bold; padding: 8px; }
+        QPushButton#dangerButton {
+            font-weight: bold; padding: 8px; background-color: #d32f2f; color: white;
+        }
+        QLabel#dangerWarning { color: red; font-weight: bold; }
+        QLabel#cautionWarning { color: orange; font-weight: bold; }
+    """
+    
     def __init__(self, container: ApplicationContainer):
         """Initialize main window.
         
@@ -32,6 +41,7 @@ class MainWindow(QMainWindow):
         """
         super().__init__()
         self._container = container
+        self._clean_confirm: Optional[QMessageBox] = None
         
         # Create controllers
         self._encrypt_controller = EncryptController(container)
@@ -46,55 +56,48 @@ class MainWindow(QMainWindow):
         self._init_ui()
         
     def _setup_controller_connections(self):
-        """Setup signal/slot connections for controllers."""
+        """Setup signal/slot connections for controllers.
+        
+        Progress signals are connected when each tab (and so its progress
+        bar) is built; see the _create_*_tab methods.
+        """
         # Encryption controller
-        self._encrypt_controller.progress_updated.connect(
-            lambda v: self._update_progress("encrypt", v)
-        )
         self._encrypt_controller.operation_completed.connect(
-            lambda r: self._on_encrypt_completed(r)
+            self._on_encrypt_completed
         )
         self._encrypt_controller.error_occurred.connect(
-            lambda e: self._show_error("Encryption Error", e)
+            partial(self._show_error, "Encryption Error")
         )
         
         # Decryption controller
-        self._decrypt_controller.progress_updated.connect(
-            lambda v: self._update_progress("decrypt", v)
-        )
         self._decrypt_controller.operation_completed.connect(
-            lambda r: self._on_decrypt_completed(r)
+            self._on_decrypt_completed
         )
         self._decrypt_controller.error_occurred.connect(
-            lambda e: self._show_error("Decryption Error", e)
+            partial(self._show_error, "Decryption Error")
         )
         
         # Cleaning controller
-        self._clean_controller.progress_updated.connect(
-            lambda v: self._update_progress("clean", v)
-        )
         self._clean_controller.operation_completed.connect(
-            lambda s, m: self._on_clean_completed(s, m)
+            self._on_clean_completed
         )
         self._clean_controller.error_occurred.connect(
-            lambda e: self._show_error("Cleaning Error", e)
+            partial(self._show_error, "Cleaning Error")
         )
         
         # Key generation controller
-        self._key_controller.progress_updated.connect(
-            lambda v: self._update_progress("key", v)
-        )
         self._key_controller.operation_completed.connect(
-            lambda s, m: self._on_key_completed(s, m)
+            self._on_key_completed
         )
         self._key_controller.error_occurred.connect(
-            lambda e: self._show_error("Key Generation Error", e)
+            partial(self._show_error, "Key Generation Error")
         )
         
     def _init_ui(self):
         """Initialize UI components."""
         self.setWindowTitle("Zesec - Secure File Manager")
         self.setMinimumSize(700, 600)
+        self.setStyleSheet(self._STYLE_SHEET)
         
         # Central widget
         central_widget = QWidget()
@@ -104,24 +107,46 @@ class MainWindow(QMainWindow):
         main_layout = QVBoxLayout(central_widget)
         
         # Create tab widget
-        tabs = QTabWidget()
-        main_layout.addWidget(tabs)
-        
-        # Encryption tab
-        encrypt_tab = self._create_encrypt_tab()
-        tabs.addTab(encrypt_tab, "Encryption")
-        
-        # Decryption tab
-        decrypt_tab = self._create_decrypt_tab()
-        tabs.addTab(decrypt_tab, "Decryption")
+        self._tabs = QTabWidget()
+        main_layout.addWidget(self._tabs)
+        
+        # Tabs are built the first time they are shown; until then each one
+        # holds an empty placeholder
+        self._tab_builders = (
+            ("Encryption", self._create_encrypt_tab),
+            ("Decryption", self._create_decrypt_tab),
+            ("Cleaning", self._create_clean_tab),
+            ("Key Management", self._create_key_tab),
+        )
+        self._built_tabs: set[int] = set()
+        for title, _ in self._tab_builders:
+            self._tabs.addTab(QWidget(), title)
+        self._tabs.currentChanged.connect(self._ensure_tab_built)
+        self._ensure_tab_built(self._tabs.currentIndex())
         
-        # Cleaning tab
-        clean_tab = self._create_clean_tab()
-        tabs.addTab(clean_tab, "Cleaning")
+    def _ensure_tab_built(self, index: int):
+        """Replace a tab's placeholder with its real content on first use.
         
-        # Key Management tab
-        key_tab = self._create_key_tab()
-        tabs.addTab(key_tab, "Key Management")
+        Args:
+            index: Index of the tab being shown
+        """
+        if index < 0 or index in self._built_tabs:
+            return
+        self._built_tabs.add(index)
+        
+        title, build = self._tab_builders[index]
+        placeholder = self._tabs.widget(index)
+        
+        # Swapping the widget moves the current tab; keep that from
+        # re-entering this slot
+        self._tabs.blockSignals(True)
+        try:
+            self._tabs.removeTab(index)
+            self._tabs.insertTab(index, build(), title)
+            self._tabs.setCurrentIndex(index)
+        finally:
+            self._tabs.blockSignals(False)
+        placeholder.deleteLater()
         
     def _create_encrypt_tab(self) -> QWidget:
         """Create encryption tab."""
@@ -162,10 +187,13 @@ class MainWindow(QMainWindow):
         self._encrypt_progress = QProgressBar()
         self._encrypt_progress.setVisible(False)
         layout.addWidget(self._encrypt_progress)
+        # Progress drives the bar's setValue slot directly, without a
+        # Python call per update
+        self._encrypt_controller.progress_updated.connect(self._encrypt_progress.setValue)
         
         # Encrypt button
         encrypt_btn = QPushButton("Encrypt File")
-        encrypt_btn.setStyleSheet("font-weight: bold; padding: 8px;")
+        encrypt_btn.setObjectName("primaryButton")
         encrypt_btn.clicked.connect(self._on_encrypt_clicked)
         layout.addWidget(encrypt_btn)
         
@@ -202,10 +230,13 @@ class MainWindow(QMainWindow):
         self._decrypt_progress = QProgressBar()
         self._decrypt_progress.setVisible(False)
         layout.addWidget(self._decrypt_progress)
+        # Progress drives the bar's setValue slot directly, without a
+        # Python call per update
+        self._decrypt_controller.progress_updated.connect(self._decrypt_progress.setValue)
         
         # Decrypt button
         decrypt_btn = QPushButton("Decrypt File")
-        decrypt_btn.setStyleSheet("font-weight: bold; padding: 8px;")
+        decrypt_btn.setObjectName("primaryButton")
         decrypt_btn.clicked.connect(self._on_decrypt_clicked)
         layout.addWidget(decrypt_btn)
         
@@ -241,17 +272,20 @@ class MainWindow(QMainWindow):
             "This action cannot be undone!"
         )
         warning_label.setWordWrap(True)
-        warning_label.setStyleSheet("color: red; font-weight: bold;")
+        warning_label.setObjectName("dangerWarning")
         layout.addWidget(warning_label)
         
         # Progress bar
         self._clean_progress = QProgressBar()
         self._clean_progress.setVisible(False)
         layout.addWidget(self._clean_progress)
+        # Progress drives the bar's setValue slot directly, without a
+        # Python call per update
+        self._clean_controller.progress_updated.connect(self._clean_progress.setValue)
         
         # Clean button
         clean_btn = QPushButton("Clean File")
-        clean_btn.setStyleSheet("font-weight: bold; padding: 8px; background-color: #d32f2f; color: white;")
+        clean_btn.setObjectName("dangerButton")
         clean_btn.clicked.connect(self._on_clean_clicked)
         layout.addWidget(clean_btn)
         
@@ -289,17 +323,20 @@ class MainWindow(QMainWindow):
             "You will need it to decrypt files encrypted with this key."
         )
         warning_label.setWordWrap(True)
-        warning_label.setStyleSheet("color: orange; font-weight: bold;")
+        warning_label.setObjectName("cautionWarning")
         layout.addWidget(warning_label)
         
         # Progress bar
         self._key_progress = QProgressBar()
         self._key_progress.setVisible(False)
         layout.addWidget(self._key_progress)
+        # Progress drives the bar's setValue slot directly, without a
+        # Python call per update
+        self._key_controller.progress_updated.connect(self._key_progress.setValue)
         
         # Generate button
         generate_btn = QPushButton("Generate Key File")
-        generate_btn.setStyleSheet("font-weight: bold; padding: 8px;")
+        generate_btn.setObjectName("primaryButton")
         generate_btn.clicked.connect(self._on_generate_key_clicked)
         layout.addWidget(generate_btn)
         
@@ -312,7 +349,7 @@ class MainWindow(QMainWindow):
             self, "Save Key File", "", "Key Files (*.key);;All Files (*)"
         )
         if path:
-            self._key_file_selector.set_path(Path(path))
+            self._key_file_selector.set_path(path)
             
     def _on_encrypt_clicked(self):
         """Handle encrypt button click."""
@@ -321,7 +358,7 @@ class MainWindow(QMainWindow):
             self._show_error("Validation Error", "Please select a file to encrypt.")
             return
             
-        password = self._encrypt_password.get_password()
+        password = self._encrypt_password.get_password_bytes()
         if not password:
             self._show_error("Validation Error", "Please enter a password.")
             return
@@ -330,16 +367,15 @@ class MainWindow(QMainWindow):
         clean_original = self._encrypt_clean_original.isChecked()
         
         # Show progress
-        self._encrypt_progress.setVisible(True)
-        self._encrypt_progress.setValue(0)
+        self._begin_progress(self._encrypt_progress)
         
-        # Start encryption
-        self._encrypt_controller.encrypt_file(
+        # Start encryption once the event loop has shown the progress bar
+        QTimer.singleShot(0, lambda: self._encrypt_controller.encrypt_file(
             file_path,
             password,
             key_file_path,
             clean_original
-        )
+        ))
         
     def _on_decrypt_clicked(self):
         """Handle decrypt button click."""
@@ -348,7 +384,7 @@ class MainWindow(QMainWindow):
             self._show_error("Validation Error", "Please select an encrypted file.")
             return
             
-        password = self._decrypt_password.get_password()
+        password = self._decrypt_password.get_password_bytes()
         if not password:
             self._show_error("Validation Error", "Please enter a password.")
             return
@@ -356,15 +392,14 @@ class MainWindow(QMainWindow):
         key_file_path = self._decrypt_key_file_selector.get_path()
         
         # Show progress
-        self._decrypt_progress.setVisible(True)
-        self._decrypt_progress.setValue(0)
+        self._begin_progress(self._decrypt_progress)
         
-        # Start decryption
-        self._decrypt_controller.decrypt_file(
+        # Start decryption once the event loop has shown the progress bar
+        QTimer.singleShot(0, lambda: self._decrypt_controller.decrypt_file(
             file_path,
             password,
             key_file_path
-        )
+        ))
         
     def _on_clean_clicked(self):
         """Handle clean button click."""
@@ -373,25 +408,29 @@ class MainWindow(QMainWindow):
             self._show_error("Validation Error", "Please select a file to clean.")
             return
             
-        # Confirm action
-        reply = QMessageBox.question(
-            self,
-            "Confirm Cleaning",
-            "Are you sure you want to securely clean this file?\n\n"
-            "This will permanently overwrite the file content and cannot be undone!",
-            QMessageBox.Yes | QMessageBox.No,
-            QMessageBox.No
-        )
+        # Confirm action (the dialog is built once and reused)
+        if self._clean_confirm is None:
+            self._clean_confirm = QMessageBox(
+                QMessageBox.Question,
+                "Confirm Cleaning",
+                "Are you sure you want to securely clean this file?\n\n"
+                "This will permanently overwrite the file content and cannot be undone!",
+                QMessageBox.Yes | QMessageBox.No,
+                self
+            )
+            self._clean_confirm.setDefaultButton(QMessageBox.No)
         
-        if reply == QMessageBox.Yes:
+        if self._clean_confirm.exec() == QMessageBox.Yes:
             delete = self._clean_delete.isChecked()
             
             # Show progress
-            self._clean_progress.setVisible(True)
-            self._clean_progress.setValue(0)
+            self._begin_progress(self._clean_progress)
             
-            # Start cleaning
-            self._clean_controller.clean_file(file_path, delete)
+            # Start cleaning once the event loop has closed the dialog and
+            # shown the progress bar
+            QTimer.singleShot(
+                0, lambda: self._clean_controller.clean_file(file_path, delete)
+            )
             
     def _on_generate_key_clicked(self):
         """Handle generate key button click."""
@@ -400,6 +439,7 @@ class MainWindow(QMainWindow):
             self._show_error("Validation Error", "Please select a location to save the key file.")
             return
             
+        overwrite = False
         if key_file_path.exists():
             reply = QMessageBox.question(
                 self,
@@ -410,25 +450,25 @@ class MainWindow(QMainWindow):
             )
             if reply != QMessageBox.Yes:
                 return
+            overwrite = True
                 
         # Show progress
-        self._key_progress.setVisible(True)
-        self._key_progress.setValue(0)
-        
-        # Start key generation
-        self._key_controller.generate_key_file(key_file_path)
-        
-    def _update_progress(self, operation: str, value: int):
-        """Update progress bar for an operation."""
-        if operation == "encrypt":
-            self._encrypt_progress.setValue(value)
-        elif operation == "decrypt":
-            self._decrypt_progress.setValue(value)
-        elif operation == "clean":
-            self._clean_progress.setValue(value)
-        elif operation == "key":
-            self._key_progress.setValue(value)
-            
+        self._begin_progress(self._key_progress)
+        
+        # Start key generation once the event loop has shown the progress bar
+        QTimer.singleShot(
+            0, lambda: self._key_controller.generate_key_file(key_file_path, overwrite)
+        )
+        
+    def _begin_progress(self, bar: QProgressBar):
+        """Show a progress bar, rewound, for a new operation.
+        
+        Both changes land in the same event loop turn, so Qt paints the bar
+        once with its final state.
+        """
+        bar.reset()
+        bar.setVisible(True)
+        
     def _on_encrypt_completed(self, result: EncryptionResult):
         """Handle encryption completion."""
         self._encrypt_progress.setVisible(False)
@@ -1,2 +1,2 @@
-"""Worker threads for async operations."""
+"""Worker tasks for async operations, run on the shared QThreadPool."""
 
@@ -1,25 +1,29 @@
-"""Worker thread for file cleaning operations."""
+"""Worker task for file cleaning operations."""
 
+import threading
 from pathlib import Path
 
-from PySide6.QtCore import QThread, Signal
+from PySide6.QtCore import QObject, QRunnable, Signal
 
 from ...interfaces.cleaner_interface import ICleaner
 
 
-class CleanWorker(QThread):
-    """Worker thread for file cleaning operations."""
+class CleanSignals(QObject):
+    """Signals emitted by a CleanWorker."""
     
     progress = Signal(int)  # 0-100
     finished = Signal(bool, str)  # success, message
     error = Signal(str)
+
+
+class CleanWorker(QRunnable):
+    """Task for file cleaning operations, run on the shared QThreadPool."""
     
     def __init__(
         self,
         cleaner: ICleaner,
         file_path: Path,
-        delete: bool = True,
-        parent=None
+        delete: bool = True
     ):
         """Initialize cleaning worker.
         
@@ -27,31 +31,46 @@ class CleanWorker(QThread):
             cleaner: Cleaning service
             file_path: Path to file to clean
             delete: Whether to delete file after cleaning
-            parent: Parent QObject
         """
-        super().__init__(parent)
+        super().__init__()
+        # The controller keeps the task referenced until it is done, so the
+        # pool must not delete it after run()
+        self.setAutoDelete(False)
+        self.signals = CleanSignals()
         self._cleaner = cleaner
         self._file_path = file_path
         self._delete = delete
+        self._cancel = threading.Event()
+        self._done = threading.Event()
+        
+    def request_cancel(self):
+        """Ask the running operation to stop at its next checkpoint."""
+        self._cancel.set()
+        
+    def is_done(self) -> bool:
+        """Whether run() has finished."""
+        return self._done.is_set()
         
     def run(self):
-        """Execute cleaning in background thread."""
+        """Execute cleaning on a pool thread."""
         try:
-            self.progress.emit(10)
+            self.signals.progress.emit(10)
             
             success = self._cleaner.clean_file(
                 self._file_path,
-                delete=self._delete
+                delete=self._delete,
+                cancel=self._cancel
             )
             
-            self.progress.emit(100)
+            self.signals.progress.emit(100)
             
             if success:
                 action = "cleaned and deleted" if self._delete else "cleaned"
-                self.finished.emit(True, f"File {action} successfully")
+                self.signals.finished.emit(True, f"File {action} successfully")
             else:
-                self.finished.emit(False, "Cleaning failed")
+                self.signals.finished.emit(False, "Cleaning failed")
                 
         except Exception as e:
-            self.error.emit(str(e))
-
+            self.signals.error.emit(str(e))
+        finally:
+            self._done.set()
@@ -1,58 +1,81 @@
-"""Worker thread for decryption operations."""
+"""Worker task for decryption operations."""
 
+import threading
 from pathlib import Path
 from typing import Optional
 
-from PySide6.QtCore import QThread, Signal
+from PySide6.QtCore import QObject, QRunnable, Signal
 
 from ...interfaces.encryptor_interface import IEncryptor
 from ...core.models.encryption_result import EncryptionResult
+from ...utils.secure_memory import wipe_buffer
 
 
-class DecryptWorker(QThread):
-    """Worker thread for decryption operations."""
+class DecryptSignals(QObject):
+    """Signals emitted by a DecryptWorker."""
     
     progress = Signal(int)  # 0-100
     finished = Signal(EncryptionResult)
     error = Signal(str)
+
+
+class DecryptWorker(QRunnable):
+    """Task for decryption operations, run on the shared QThreadPool."""
     
     def __init__(
         self,
         encryptor: IEncryptor,
         file_path: Path,
-        password: str,
-        key_file_path: Optional[Path] = None,
-        parent=None
+        password: str | bytearray,
+        key_file_path: Optional[Path] = None
     ):
         """Initialize decryption worker.
         
         Args:
             encryptor: Encryption service
             file_path: Path to encrypted file
-            password: Decryption password
+            password: Decryption password. A bytearray is wiped once the
+                operation is over.
             key_file_path: Optional key file path
-            parent: Parent QObject
         """
-        super().__init__(parent)
+        super().__init__()
+        # The controller keeps the task referenced until it is done, so the
+        # pool must not delete it after run()
+        self.setAutoDelete(False)
+        self.signals = DecryptSignals()
         self._encryptor = encryptor
         self._file_path = file_path
         self._password = password
         self._key_file_path = key_file_path
+        self._cancel = threading.Event()
+        self._done = threading.Event()
+        
+    def request_cancel(self):
+        """Ask the running operation to stop at its next checkpoint."""
+        self._cancel.set()
+        
+    def is_done(self) -> bool:
+        """Whether run() has finished."""
+        return self._done.is_set()
         
     def run(self):
-        """Execute decryption in background thread."""
+        """Execute decryption on a pool thread."""
         try:
-            self.progress.emit(10)
+            self.signals.progress.emit(10)
             
             result = self._encryptor.decrypt_file(
                 self._file_path,
                 self._password,
-                key_file_path=self._key_file_path
+                key_file_path=self._key_file_path,
+                cancel=self._cancel
             )
             
-            self.progress.emit(100)
-            self.finished.emit(result)
+            self.signals.progress.emit(100)
+            self.signals.finished.emit(result)
             
         except Exception as e:
-            self.error.emit(str(e))
-
+            self.signals.error.emit(str(e))
+        finally:
+            if isinstance(self._password, bytearray):
+                wipe_buffer(self._password)
+            self._done.set()
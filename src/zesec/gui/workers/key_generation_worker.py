@@ -1,50 +1,85 @@
-"""Worker thread for key generation operations."""
+"""Worker task for key generation operations."""
 
+import threading
 from pathlib import Path
 
-from PySide6.QtCore import QThread, Signal
+from PySide6.QtCore import QObject, QRunnable, Signal
 
 from ...core.encryption import KeyManager
 
 
-class KeyGenerationWorker(QThread):
-    """Worker thread for key generation operations."""
+class KeyGenerationSignals(QObject):
+    """Signals emitted by a KeyGenerationWorker."""
     
     progress = Signal(int)  # 0-100
     finished = Signal(bool, str)  # success, message
     error = Signal(str)
+
+
+class KeyGenerationWorker(QRunnable):
+    """Task for key generation operations, run on the shared QThreadPool."""
     
     def __init__(
         self,
         key_manager: KeyManager,
         key_file_path: Path,
-        parent=None
+        overwrite: bool = False
     ):
         """Initialize key generation worker.
         
         Args:
             key_manager: Key manager service
             key_file_path: Path where key file should be saved
-            parent: Parent QObject
+            overwrite: Whether an existing file may be replaced
         """
-        super().__init__(parent)
+        super().__init__()
+        # The controller keeps the task referenced until it is done, so the
+        # pool must not delete it after run()
+        self.setAutoDelete(False)
+        self.signals = KeyGenerationSignals()
         self._key_manager = key_manager
         self._key_file_path = key_file_path
+        self._overwrite = overwrite
+        self._cancel = threading.Event()
+        self._done = threading.Event()
+        
+    def request_cancel(self):
+        """Ask the running key generation to stop at its next checkpoint."""
+        self._cancel.set()
+        
+    def is_done(self) -> bool:
+        """Whether run() has finished."""
+        return self._done.is_set()
         
     def run(self):
-        """Execute key generation in background thread."""
+        """Execute key generation on a pool thread.
+        
+        Cancellation is cooperative and only checked before the key file is
+        written. The write replaces any existing file atomically, so once
+        it has happened it is reported as done rather than undone: removing
+        the new file would lose the key it replaced as well.
+        """
         try:
-            self.progress.emit(10)
-            
-            success = self._key_manager.generate_key_file(self._key_file_path)
+            self.signals.progress.emit(10)
+
+            if self._cancel.is_set():
+                self.signals.finished.emit(False, "Key generation cancelled")
+                return
             
-            self.progress.emit(100)
+            success = self._key_manager.generate_key_file(
+                self._key_file_path, overwrite=self._overwrite
+            )
+
+            self.signals.progress.emit(100)
             
             if success:
-                self.finished.emit(True, f"Key file generated: {self._key_file_path}")
+                self.signals.finished.emit(True, f"Key file generated: {self._key_file_path}")
             else:
-                self.finished.emit(False, "Failed to generate key file")
+                self.signals.finished.emit(False, "Failed to generate key file")
                 
+        except FileExistsError:
+            self.signals.error.emit("File already exists. Please choose a different path.")
         except Exception as e:
-            self.error.emit(str(e))
-
+            self.signals.error.emit(str(e))
+        finally:
+            self._done.set()
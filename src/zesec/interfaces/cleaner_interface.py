@@ -1,11 +1,10 @@
 """Interface for secure file cleaning operations."""
 
-from abc import abstractmethod
+import threading
 from pathlib import Path
-from typing import Protocol, runtime_checkable
+from typing import Protocol
 
 
-@runtime_checkable
 class ICleaner(Protocol):
     """Protocol defining secure file cleaning contract.
     
@@ -13,47 +12,57 @@ class ICleaner(Protocol):
     before deletion to remove residual data.
     """
 
-    @abstractmethod
-    def clean_file(self, file_path: Path, passes: int = 3, delete: bool = True) -> bool:
+    def clean_file(
+        self,
+        file_path: Path,
+        passes: int | None = None,
+        delete: bool = True,
+        cancel: threading.Event | None = None,
+    ) -> bool:
         """Securely clean a file by overwriting and optionally deleting.
         
         Args:
             file_path: Path to the file to clean
-            passes: Number of overwrite passes (default: 3)
+            passes: Number of overwrite passes (default: CLEAN_PASSES, or a
+                single pass on solid-state storage)
             delete: If True, delete file after cleaning (default: True)
+            cancel: Optional event; once set, cleaning stops and the file is
+                left in place
             
         Returns:
             True if successful, False otherwise
         """
         ...
 
-    @abstractmethod
     def clean_directory(
         self,
         dir_path: Path,
-        passes: int = 3,
+        passes: int | None = None,
         recursive: bool = True,
         delete: bool = True,
+        cancel: threading.Event | None = None,
     ) -> bool:
         """Securely clean all files in a directory.
         
         Args:
             dir_path: Path to the directory
-            passes: Number of overwrite passes per file
+            passes: Number of overwrite passes per file (default as for
+                clean_file)
             recursive: If True, process subdirectories
             delete: If True, delete files after cleaning (default: True)
+            cancel: Optional event; once set, remaining files are skipped
             
         Returns:
             True if all files cleaned successfully, False otherwise
         """
         ...
 
-    @abstractmethod
     def overwrite_file(
         self,
         file_path: Path,
         data: bytes | None = None,
         passes: int = 1,
+        cancel: threading.Event | None = None,
     ) -> bool:
         """Overwrite file content without deleting.
         
@@ -61,6 +70,7 @@ class ICleaner(Protocol):
             file_path: Path to the file
             data: Data to write. If None, writes zeros
             passes: Number of overwrite passes
+            cancel: Optional event checked between buffer writes
             
         Returns:
             True if successful, False otherwise
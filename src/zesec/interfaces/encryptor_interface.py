@@ -1,13 +1,12 @@
 """Interface for encryption operations."""
 
-from abc import ABC, abstractmethod
+import threading
 from pathlib import Path
-from typing import Protocol, runtime_checkable
+from typing import Protocol
 
 from ..core.models.encryption_result import EncryptionResult
 
 
-@runtime_checkable
 class IEncryptor(Protocol):
     """Protocol defining encryption contract.
     
@@ -15,67 +14,73 @@ class IEncryptor(Protocol):
     and presentation layers (console/GUI).
     """
 
-    @abstractmethod
     def encrypt_file(
         self,
         file_path: Path,
-        password: str,
+        password: str | bytearray,
         output_path: Path | None = None,
         clean_original: bool = True,
         key_file_path: Path | None = None,
+        cancel: threading.Event | None = None,
     ) -> EncryptionResult:
         """Encrypt a file.
         
         Args:
             file_path: Path to the file to encrypt
-            password: Password for encryption
+            password: Password for encryption (text or UTF-8 buffer)
             output_path: Optional output path. If None, uses file_path with .zesec extension
             clean_original: If True, securely clean original file after encryption
             key_file_path: Optional path to key file. If provided, combines with password
+            cancel: Optional event; once set, encryption stops without leaving
+                a partial output file
             
         Returns:
             EncryptionResult with success status and output path
         """
         ...
 
-    @abstractmethod
     def decrypt_file(
         self,
         file_path: Path,
-        password: str,
+        password: str | bytearray,
         output_path: Path | None = None,
         key_file_path: Path | None = None,
+        cancel: threading.Event | None = None,
     ) -> EncryptionResult:
         """Decrypt a file.
         
         Args:
             file_path: Path to the encrypted file
-            password: Password used for encryption
+            password: Password used for encryption (text or UTF-8 buffer)
             output_path: Optional output path. If None, removes .zesec extension
             key_file_path: Optional path to key file. Required if used during encryption
+            cancel: Optional event; once set, decryption stops without leaving
+                a partial output file
             
         Returns:
             EncryptionResult with success status and output path
         """
         ...
 
-    @abstractmethod
     def encrypt_directory(
         self,
         dir_path: Path,
-        password: str,
+        password: str | bytearray,
         clean_originals: bool = True,
         recursive: bool = True,
         key_file_path: Path | None = None,
+        cancel: threading.Event | None = None,
     ) -> list[EncryptionResult]:
         """Encrypt all files in a directory.
         
         Args:
             dir_path: Path to the directory
-            password: Password for encryption
+            password: Password for encryption (text or UTF-8 buffer)
             clean_originals: If True, securely clean original files
             recursive: If True, process subdirectories
             key_file_path: Optional path to key file. If provided, combines with password
+            cancel: Optional event; once set, files not yet encrypted fail
+                as cancelled
             
         Returns:
             List of EncryptionResult for each file processed
@@ -1,18 +1,16 @@
 """Interface for file I/O operations."""
 
-from abc import abstractmethod
+from contextlib import AbstractContextManager
 from pathlib import Path
-from typing import Protocol, runtime_checkable
+from typing import Iterable, Protocol
 
 
-@runtime_checkable
 class IFileHandler(Protocol):
     """Protocol defining file I/O contract.
     
     Provides cross-platform file operations abstraction.
     """
 
-    @abstractmethod
     def read_file(self, file_path: Path) -> bytes:
         """Read file contents as bytes.
         
@@ -28,7 +26,38 @@ class IFileHandler(Protocol):
         """
         ...
 
-    @abstractmethod
+    def read_bounded(self, file_path: Path, max_bytes: int) -> bytes:
+        """Read a file that must not be larger than max_bytes.
+        
+        Args:
+            file_path: Path to the file
+            max_bytes: Maximum accepted file size
+            
+        Returns:
+            File contents as bytes
+            
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            IOError: If file cannot be read or is larger than max_bytes
+        """
+        ...
+
+    def map_file(self, file_path: Path) -> AbstractContextManager[bytes | memoryview]:
+        """Open file contents for reading without copying where possible.
+        
+        Args:
+            file_path: Path to the file
+            
+        Returns:
+            Context manager yielding the file contents. The contents must
+            not be used after the context exits.
+            
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            IOError: If file cannot be read
+        """
+        ...
+
     def write_file(self, file_path: Path, data: bytes) -> bool:
         """Write bytes to a file.
         
@@ -41,7 +70,30 @@ class IFileHandler(Protocol):
         """
         ...
 
-    @abstractmethod
+    def write_stream(
+        self,
+        file_path: Path,
+        chunks: Iterable[bytes],
+        atomic: bool = False,
+        exclusive: bool = False,
+    ) -> None:
+        """Write a sequence of chunks to a file.
+        
+        Args:
+            file_path: Path to the file
+            chunks: Data chunks to write, in order
+            atomic: If True, write to a temporary file and only move it into
+                place once every chunk was written
+            exclusive: If True, only create a new file and never replace an
+                existing one
+            
+        Raises:
+            FileExistsError: If exclusive is set and file_path already exists
+            IOError: If the file cannot be written. Exceptions raised while
+                producing chunks propagate unchanged.
+        """
+        ...
+
     def file_exists(self, file_path: Path) -> bool:
         """Check if file exists.
         
@@ -53,7 +105,6 @@ class IFileHandler(Protocol):
         """
         ...
 
-    @abstractmethod
     def get_file_size(self, file_path: Path) -> int:
         """Get file size in bytes.
         
@@ -68,7 +119,6 @@ class IFileHandler(Protocol):
         """
         ...
 
-    @abstractmethod
     def ensure_directory(self, dir_path: Path) -> bool:
         """Ensure directory exists, create if needed.
         
@@ -5,18 +5,25 @@ from .exceptions import (
     DecryptionError,
     FileOperationError,
     CleanerError,
+    OperationCancelledError,
 )
+from .cancellation import raise_if_cancelled
 from .logging_config import get_logger, setup_logging
 from .platform import Platform, get_platform
+from .secure_memory import to_secret_buffer, wipe_buffer
 
 __all__ = [
     "EncryptionError",
     "DecryptionError",
     "FileOperationError",
     "CleanerError",
+    "OperationCancelledError",
+    "raise_if_cancelled",
     "get_logger",
     "setup_logging",
     "Platform",
     "get_platform",
+    "to_secret_buffer",
+    "wipe_buffer",
 ]
 
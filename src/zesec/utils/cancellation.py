@@ -0,0 +1,22 @@
+"""Helpers for cooperative cancellation of long-running operations."""
+
+import threading
+from typing import Optional
+
+from .exceptions import OperationCancelledError
+
+
+def raise_if_cancelled(cancel: Optional[threading.Event]) -> None:
+    """Stop an operation if cancellation was requested.
+    
+    Long-running loops call this between units of work, so an operation
+    can be cancelled from another thread without killing that thread.
+    
+    Args:
+        cancel: Event set by the caller to request cancellation, or None
+        
+    Raises:
+        OperationCancelledError: If cancel is set
+    """
+    if cancel is not None and cancel.is_set():
+        raise OperationCancelledError("Operation cancelled")
@@ -37,6 +37,12 @@ class KeyDerivationError(ZesecError):
     pass
 
 
+class OperationCancelledError(ZesecError):
+    """Raised when an operation is cancelled before it completes."""
+
+    pass
+
+
 class ConfigurationError(ZesecError):
     """Raised when configuration is invalid."""
 
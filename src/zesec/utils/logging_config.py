@@ -4,7 +4,26 @@ import sys
 
 from loguru import logger
 
-from ..config.settings import Settings
+from ..config.settings import get_settings
+
+# Color markup per level, applied by <level> tags in the console format
+_LEVEL_COLORS = {
+    "INFO": "<green>",
+    "WARNING": "<yellow>",
+    "ERROR": "<red>",
+    "CRITICAL": "<red><bold>",
+    "SUCCESS": "<green>",
+    "DEBUG": "<blue>",
+}
+
+# Loguru compiles a string format once per level, instead of calling back
+# into Python for every record
+_CONSOLE_FORMAT = (
+    "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
+    "<level>{level: <8}</level> | "
+    "<cyan>{name}</cyan>:<cyan>{function}</cyan> | "
+    "<level>{message}</level>"
+)
 
 
 def setup_logging() -> None:
@@ -17,57 +36,13 @@ def setup_logging() -> None:
     On Windows GUI apps (PyInstaller), sys.stderr may be None, so we
     check for availability before adding the handler.
     """
-    settings = Settings.get_instance()
+    settings = get_settings()
 
     # Remove default handler
     logger.remove()
 
-    def format_console(record: dict) -> str:
-        """Format log record with custom colors.
-        
-        Colors:
-        - INFO: green
-        - WARNING: yellow
-        - ERROR: red
-        """
-        # Color mapping based on level
-        level_colors = {
-            "INFO": ("<green>", "</green>"),
-            "WARNING": ("<yellow>", "</yellow>"),
-            "ERROR": ("<red>", "</red>"),
-            "CRITICAL": ("<red><bold>", "</bold></red>"),
-            "SUCCESS": ("<green>", "</green>"),
-            "DEBUG": ("<blue>", "</blue>"),
-        }
-        
-        level_name = record["level"].name
-        color_tags = level_colors.get(level_name, ("", ""))
-        color_open, color_close = color_tags
-        
-        time_str = record["time"].strftime("%Y-%m-%d %H:%M:%S")
-        name = record["name"]
-        function = record["function"]
-        message = record["message"]
-        
-        # Build formatted string
-        formatted = f"<green>{time_str}</green> | "
-        
-        # Colorize level
-        if color_open:
-            formatted += f"{color_open}{level_name: <8}{color_close} | "
-        else:
-            formatted += f"{level_name: <8} | "
-        
-        # Module and function names
-        formatted += f"<cyan>{name}</cyan>:<cyan>{function}</cyan> | "
-        
-        # Colorize message
-        if color_open:
-            formatted += f"{color_open}{message}{color_close}"
-        else:
-            formatted += message
-        
-        return formatted + "\n"
+    for level_name, color in _LEVEL_COLORS.items():
+        logger.level(level_name, color=color)
 
     # Console handler with colorization (only if stderr is available)
     # On Windows GUI apps, sys.stderr may be None
@@ -75,7 +50,7 @@ def setup_logging() -> None:
         try:
             logger.add(
                 sys.stderr,
-                format=format_console,
+                format=_CONSOLE_FORMAT,
                 level=settings.LOG_LEVEL,
                 colorize=True,
             )
@@ -1,8 +1,11 @@
 """Cross-platform utilities and platform detection."""
 
+import os
 import platform
 from enum import Enum
+from functools import cache, lru_cache
 from pathlib import Path
+from typing import Optional
 
 
 class Platform(Enum):
@@ -14,9 +17,13 @@ class Platform(Enum):
     UNKNOWN = "unknown"
 
 
+@cache
 def get_platform() -> Platform:
     """Detect the current platform.
     
+    The platform cannot change while the process runs, so the result is
+    cached.
+    
     Returns:
         Platform enum value
     """
@@ -31,15 +38,116 @@ def get_platform() -> Platform:
         return Platform.UNKNOWN
 
 
+@cache
 def get_home_directory() -> Path:
     """Get user home directory in a cross-platform way.
     
+    Resolved once per process; the result is cached.
+    
     Returns:
         Path to home directory
     """
     return Path.home()
 
 
+@cache
+def enable_ansi_escapes() -> bool:
+    """Make sure the console understands ANSI escape sequences.
+    
+    Always true on POSIX terminals. On Windows 10+ this switches on virtual
+    terminal processing for stdout; the result is cached so it happens once.
+    
+    Returns:
+        True if ANSI escape sequences can be written to stdout
+    """
+    if os.name != "nt":
+        return True
+
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = wintypes.DWORD()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except (AttributeError, OSError):
+        return False
+
+
+@cache
+def has_sha_ni() -> Optional[bool]:
+    """Check whether the CPU has the x86 SHA extensions (SHA-NI).
+    
+    OpenSSL uses them for SHA-256 automatically when present. The CPU
+    flags are read from /proc/cpuinfo, so the answer is only known on
+    x86 Linux; the result is cached.
+    
+    Returns:
+        True or False on x86 Linux, None where it cannot be determined
+    """
+    if platform.machine() not in ("x86_64", "AMD64", "i686", "i386"):
+        return None
+    try:
+        with open("/proc/cpuinfo", encoding="ascii", errors="replace") as f:
+            for line in f:
+                if line.startswith("flags"):
+                    return "sha_ni" in line.split()
+    except OSError:
+        pass
+    return None
+
+
+def is_ssd(path: str | Path) -> Optional[bool]:
+    """Check whether a file lives on non-rotational (solid-state) storage.
+    
+    Only Linux is supported, where the block device behind the path reports
+    it in /sys; the answer is cached per device.
+    
+    Args:
+        path: Existing file or directory
+        
+    Returns:
+        True for solid-state storage, False for spinning disks, None where
+        it cannot be determined (other platforms, network or virtual
+        filesystems)
+    """
+    if get_platform() != Platform.LINUX:
+        return None
+    try:
+        dev = os.stat(path).st_dev
+    except OSError:
+        return None
+    return _is_ssd_device(dev)
+
+
+@lru_cache(maxsize=32)
+def _is_ssd_device(dev: int) -> Optional[bool]:
+    """Read the rotational flag of a Linux block device.
+    
+    Args:
+        dev: Device number (st_dev)
+        
+    Returns:
+        True if the device is non-rotational, False if rotational, None if
+        the device has no queue information
+    """
+    try:
+        device_dir = Path(
+            os.path.realpath(f"/sys/dev/block/{os.major(dev)}:{os.minor(dev)}")
+        )
+        # Partitions share the queue of the disk they belong to
+        if (device_dir / "partition").exists():
+            device_dir = device_dir.parent
+        rotational = (device_dir / "queue" / "rotational").read_text().strip()
+    except OSError:
+        return None
+    return rotational == "0"
+
+
 def normalize_path(path: str | Path) -> Path:
     """Normalize a path for cross-platform compatibility.
     
@@ -51,3 +159,21 @@ def normalize_path(path: str | Path) -> Path:
     """
     return Path(path).expanduser().resolve()
 
+
+def resolve_and_stat(path: str | Path) -> tuple[Path, Optional[os.stat_result]]:
+    """Resolve a path and stat it once.
+    
+    Callers can answer exists/is-file/is-directory questions from the
+    returned stat result instead of issuing a stat call for each.
+    
+    Args:
+        path: Path string or Path object
+        
+    Returns:
+        Tuple of (resolved path, stat result or None if the path doesn't exist)
+    """
+    resolved = os.path.realpath(path)
+    try:
+        return Path(resolved), os.stat(resolved)
+    except (FileNotFoundError, NotADirectoryError):
+        return Path(resolved), None
@@ -0,0 +1,26 @@
+"""Helpers for keeping secrets in mutable, wipeable buffers."""
+
+
+def to_secret_buffer(secret: str) -> bytearray:
+    """Encode a secret string into a mutable buffer.
+    
+    The buffer can be wiped with :func:`wipe_buffer` once the secret is no
+    longer needed. The original ``str`` is immutable and cannot be wiped, so
+    callers should drop their reference to it right away.
+    
+    Args:
+        secret: Secret text (e.g. a password)
+        
+    Returns:
+        UTF-8 encoded secret
+    """
+    return bytearray(secret, "utf-8")
+
+
+def wipe_buffer(buffer: bytearray) -> None:
+    """Overwrite a buffer with zeros in place.
+    
+    Args:
+        buffer: Buffer to wipe
+    """
+    buffer[:] = bytes(len(buffer))
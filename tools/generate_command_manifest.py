@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Generate the console command manifest.
+
+Scans src/zesec/console/commands/ for @CommandRegistry.register decorators
+and writes src/zesec/console/commands/_manifest.py, so the application
+never has to scan the package at runtime. The manifest also carries each
+command's help metadata, so listing commands imports none of them.
+
+Usage:
+    python tools/generate_command_manifest.py
+"""
+
+import ast
+import json
+import sys
+from pathlib import Path
+
+COMMANDS_DIR = Path(__file__).resolve().parent.parent / "src" / "zesec" / "console" / "commands"
+MANIFEST_PATH = COMMANDS_DIR / "_manifest.py"
+
+# Package modules that never register commands
+SKIP_MODULES = {"__init__", "_manifest", "base", "loader"}
+
+HEADER = '''"""Console command manifest.
+
+Generated by tools/generate_command_manifest.py - do not edit by hand.
+"""
+'''
+
+
+def _is_register_call(node: ast.expr) -> bool:
+    """Check whether a decorator is a CommandRegistry.register(...) call."""
+    return (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and node.func.attr == "register"
+        and isinstance(node.func.value, ast.Name)
+        and node.func.value.id == "CommandRegistry"
+    )
+
+
+def find_commands(module_path: Path) -> list[tuple[str, str, str, tuple[str, ...]]]:
+    """Find the commands registered by a module.
+    
+    Args:
+        module_path: Path to the command module
+        
+    Returns:
+        (name, description, category, aliases) for each command, in source order
+    """
+    tree = ast.parse(module_path.read_text(encoding="utf-8"), filename=str(module_path))
+    commands = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.ClassDef):
+            continue
+        for decorator in node.decorator_list:
+            if not _is_register_call(decorator):
+                continue
+            kwargs = {kw.arg: kw.value for kw in decorator.keywords}
+            name_node = decorator.args[0] if decorator.args else kwargs["name"]
+            # Defaults match CommandRegistry.register
+            description = ast.literal_eval(kwargs["description"]) if "description" in kwargs else ""
+            category = ast.literal_eval(kwargs["category"]) if "category" in kwargs else "System"
+            aliases = ast.literal_eval(kwargs["aliases"]) if "aliases" in kwargs else None
+            commands.append(
+                (ast.literal_eval(name_node), description, category, tuple(aliases or ()))
+            )
+    return commands
+
+
+def _literal(value: str | tuple) -> str:
+    """Render a string or (nested) tuple of strings as a Python literal."""
+    if isinstance(value, str):
+        return json.dumps(value)
+    if len(value) == 1:
+        return f"({_literal(value[0])},)"
+    return f"({', '.join(_literal(item) for item in value)})"
+
+
+def build_manifest() -> str:
+    """Build the manifest module source.
+    
+    Returns:
+        Source code for _manifest.py
+    """
+    modules = []
+    commands = {}
+    summaries = {}
+    for module_path in sorted(COMMANDS_DIR.glob("*.py")):
+        if module_path.stem in SKIP_MODULES:
+            continue
+        found = find_commands(module_path)
+        if not found:
+            continue
+        module = f".{module_path.stem}"
+        modules.append(module)
+        for name, description, category, aliases in found:
+            for command_name in (name, *aliases):
+                commands[command_name] = module
+            summaries[name] = (description, category, aliases)
+
+    lines = [HEADER, "# Modules that register commands", "COMMANDS = ("]
+    lines += [f'    "{module}",' for module in modules]
+    lines += [")", "", "# Command name or alias -> module that registers it", "LAZY_COMMANDS = {"]
+    lines += [f'    "{name}": "{module}",' for name, module in commands.items()]
+    lines += ["}", "", "# Command name -> (description, category, aliases)", "COMMAND_SUMMARIES = {"]
+    lines += [f"    {_literal(name)}: {_literal(summary)}," for name, summary in summaries.items()]
+    lines += ["}", ""]
+    return "\n".join(lines)
+
+
+def main() -> int:
+    """Write the manifest and report what was found."""
+    source = build_manifest()
+    MANIFEST_PATH.write_text(source, encoding="utf-8")
+    print(f"Wrote {MANIFEST_PATH}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())